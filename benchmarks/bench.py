@@ -0,0 +1,144 @@
+import argparse
+import ast
+import json
+import sys
+import time
+import tracemalloc
+from argparse import Namespace
+from typing import Dict, List, Sequence
+
+from corpus import CORPUS_KINDS, generate_module
+
+from flake8_class_attributes_order.checker import ClassAttributesOrderChecker
+from flake8_class_attributes_order.model_parts_info import get_model_parts_info
+from flake8_class_attributes_order.ordering_errors import get_ordering_errors
+
+
+CUSTOM_ORDER = ['constant', 'field', 'outer_field', 'meta_class', 'nested_class', 'magic_method', 'property_method',
+                'static_method', 'class_method', 'method', 'protected_method', 'private_method']
+
+MODES: Dict[str, Dict[str, object]] = {
+    'default': {},
+    'strict': {'use_class_attributes_order_strict_mode': True},
+    'custom': {'class_attributes_order': CUSTOM_ORDER},
+    'unselected': {'select': ['E', 'F']},
+}
+
+DECISION_ENGINE_DEFAULTS: Dict[str, object] = {
+    'select': None,
+    'extend_select': None,
+    'extended_default_select': ['CCE'],
+    'ignore': None,
+    'extend_ignore': None,
+    'extended_default_ignore': [],
+}
+
+
+def make_options(mode: str) -> Namespace:
+    options = Namespace(
+        use_class_attributes_order_strict_mode=False,
+        class_attributes_order=None,
+        ignore_docstring=False,
+        **DECISION_ENGINE_DEFAULTS,
+    )
+    for option_name, option_value in MODES[mode].items():
+        setattr(options, option_name, option_value)
+    return options
+
+
+def get_percentile(samples: Sequence[float], percent: int) -> float:
+    ordered_samples = sorted(samples)
+    return ordered_samples[min(len(ordered_samples) - 1, len(ordered_samples) * percent // 100)]
+
+
+def benchmark_corpus(trees: Sequence[ast.Module], mode: str, repeat: int) -> Dict[str, float]:
+    ClassAttributesOrderChecker.parse_options(make_options(mode))
+    weights = ClassAttributesOrderChecker.ordering_policy.weights
+    class_defs = [node for tree in trees for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
+    members_count = sum(len(class_def.body) for class_def in class_defs)
+
+    latencies: List[float] = []
+    for _ in range(repeat):
+        for tree in trees:
+            started_at = time.perf_counter()
+            list(ClassAttributesOrderChecker(tree, 'benchmark.py').run())
+            latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        parts_infos = [get_model_parts_info(class_def, weights) for class_def in class_defs]
+    parts_info_time = (time.perf_counter() - started_at) / repeat
+
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        for parts_info in parts_infos:
+            get_ordering_errors(parts_info)
+    ordering_errors_time = (time.perf_counter() - started_at) / repeat
+
+    tracemalloc.start()
+    for tree in trees:
+        list(ClassAttributesOrderChecker(tree, 'benchmark.py').run())
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    run_time = sum(latencies) / repeat
+    return {
+        'files': len(trees),
+        'classes': len(class_defs),
+        'members': members_count,
+        'members_per_second': members_count / run_time,
+        'run_seconds': run_time,
+        'parts_info_seconds': parts_info_time,
+        'ordering_errors_seconds': ordering_errors_time,
+        'latency_p50_ms': get_percentile(latencies, 50) * 1000,
+        'latency_p90_ms': get_percentile(latencies, 90) * 1000,
+        'latency_p99_ms': get_percentile(latencies, 99) * 1000,
+        'peak_memory_kib': peak_memory / 1024,
+    }
+
+
+def parse_args(argv: Sequence[str]) -> Namespace:
+    parser = argparse.ArgumentParser(description='Benchmark flake8-class-attributes-order on a synthetic corpus')
+    parser.add_argument('--kinds', nargs='+', choices=CORPUS_KINDS, default=list(CORPUS_KINDS))
+    parser.add_argument('--modes', nargs='+', choices=list(MODES), default=list(MODES))
+    parser.add_argument('--files', type=int, default=20, help='Files per corpus')
+    parser.add_argument('--classes', type=int, default=20, help='Classes per file')
+    parser.add_argument('--members', type=int, default=30, help='Members per class')
+    parser.add_argument('--disorder', type=float, default=0.1, help='Share of swapped neighbour members')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    return parser.parse_args(argv)
+
+
+def format_results_table(results: List[Dict[str, object]]) -> str:
+    header = (
+        f'{"corpus":<10} {"mode":<10} {"members":>8} {"members/s":>11} {"parts_info":>10} '
+        f'{"ordering":>9} {"p50 ms":>8} {"p90 ms":>8} {"p99 ms":>8} {"peak KiB":>9}'
+    )
+    rows = [header]
+    for row in results:
+        rows.append(
+            f'{row["corpus"]:<10} {row["mode"]:<10} {row["members"]:>8} {row["members_per_second"]:>11.0f} '
+            f'{row["parts_info_seconds"]:>10.4f} {row["ordering_errors_seconds"]:>9.4f} '
+            f'{row["latency_p50_ms"]:>8.2f} {row["latency_p90_ms"]:>8.2f} {row["latency_p99_ms"]:>8.2f} '
+            f'{row["peak_memory_kib"]:>9.0f}',
+        )
+    return '\n'.join(rows)
+
+
+def main(argv: Sequence[str]) -> None:
+    args = parse_args(argv)
+    results: List[Dict[str, object]] = []
+    for kind in args.kinds:
+        trees = [
+            ast.parse(generate_module(kind, args.classes, args.members, args.disorder, seed=file_index))
+            for file_index in range(args.files)
+        ]
+        for mode in args.modes:
+            results.append({'corpus': kind, 'mode': mode, **benchmark_corpus(trees, mode, args.repeat)})
+    sys.stdout.write(json.dumps(results, indent=2) if args.json else format_results_table(results))
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,105 @@
+import random
+from typing import Callable, Dict, List
+
+
+CORPUS_KINDS = ('plain', 'django', 'nested', 'decorated', 'literal')
+
+DECORATORS = ('property', 'cached_property', 'staticmethod', 'classmethod', 'abc.abstractmethod', 'x.setter')
+
+
+def generate_module(kind: str, classes: int, members: int, disorder: float = 0.1, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    class_generator = CLASS_GENERATORS[kind]
+    chunks = ['import abc\n', 'from django.db import models\n']
+    for class_index in range(classes):
+        chunks.extend(class_generator(f'{kind.title()}{class_index}', members, disorder, randomizer))
+    return ''.join(chunks)
+
+
+def generate_plain_class(name: str, members: int, disorder: float, randomizer: random.Random) -> List[str]:
+    member_templates = [
+        '    CONSTANT_{0} = {0}\n',
+        '    field_{0} = {0}\n',
+        '    def __init__(self):\n        self.value = 1\n',
+        '    def method_{0}(self):\n        return self.value\n',
+        '    def _protected_{0}(self):\n        return None\n',
+        '    def __private_{0}(self):\n        return None\n',
+    ]
+    return generate_class(name, members, disorder, randomizer, member_templates)
+
+
+def generate_django_class(name: str, members: int, disorder: float, randomizer: random.Random) -> List[str]:
+    member_templates = [
+        '    class Meta:\n        ordering = ("id",)\n',
+        '    STATUS_{0} = "status_{0}"\n',
+        '    field_{0} = models.CharField(max_length={0})\n',
+        '    relation_{0} = models.ForeignKey("Other", on_delete=models.CASCADE)\n',
+        '    objects = models.Manager()\n',
+        '    def __str__(self):\n        return str(self.pk)\n',
+        '    def save(self, *args, **kwargs):\n        super().save(*args, **kwargs)\n',
+        '    @property\n    def computed_{0}(self):\n        return self.pk\n',
+        '    def method_{0}(self):\n        return None\n',
+    ]
+    return generate_class(name, members, disorder, randomizer, member_templates, base='models.Model')
+
+
+def generate_nested_class(name: str, members: int, disorder: float, randomizer: random.Random) -> List[str]:
+    depth = max(1, min(members // 4, 20))
+    lines = ['\n\n']
+    for level in range(depth):
+        indent = '    ' * level
+        lines.append(f'{indent}class {name}Level{level}:\n')
+        lines.append(f'{indent}    FIELD_{level} = {level}\n')
+        lines.append(f'{indent}    def method_{level}(self):\n{indent}        return {level}\n')
+    return lines
+
+
+def generate_decorated_class(name: str, members: int, disorder: float, randomizer: random.Random) -> List[str]:
+    member_templates = [
+        f'    @{decorator}\n    def decorated_{{0}}(self):\n        return None\n'
+        for decorator in DECORATORS
+    ] + [
+        '    @staticmethod\n    @abc.abstractmethod\n    def _stacked_{0}():\n        return None\n',
+        '    def method_{0}(self):\n        return None\n',
+    ]
+    return generate_class(name, members, disorder, randomizer, member_templates)
+
+
+def generate_literal_class(name: str, members: int, disorder: float, randomizer: random.Random) -> List[str]:
+    table_rows = ''.join(
+        f'    {{"id": {row}, "code": "{name}_{row}", "values": [{row}, {row + 1}], "ratio": {row / 7:.3f}}},\n'
+        for row in range(members * 10)
+    )
+    table_lines = [f'\n\n{name.upper()}_TABLE = [\n{table_rows}]\n']
+    return generate_plain_class(name, members, disorder, randomizer) + table_lines
+
+
+def generate_class(  # noqa: CFQ002
+    name: str,
+    members: int,
+    disorder: float,
+    randomizer: random.Random,
+    member_templates: List[str],
+    base: str = 'object',
+) -> List[str]:
+    template_indexes = sorted(randomizer.randrange(len(member_templates)) for _ in range(members))
+    for position in range(len(template_indexes) - 1):
+        if randomizer.random() < disorder:
+            template_indexes[position], template_indexes[position + 1] = (
+                template_indexes[position + 1], template_indexes[position],
+            )
+    lines = [f'\n\nclass {name}({base}):\n', '    """Generated class."""\n']
+    lines.extend(
+        member_templates[template_index].format(member_index)
+        for member_index, template_index in enumerate(template_indexes)
+    )
+    return lines
+
+
+CLASS_GENERATORS: Dict[str, Callable[[str, int, float, random.Random], List[str]]] = {
+    'plain': generate_plain_class,
+    'django': generate_django_class,
+    'nested': generate_nested_class,
+    'decorated': generate_decorated_class,
+    'literal': generate_literal_class,
+}
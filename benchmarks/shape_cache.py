@@ -0,0 +1,193 @@
+import argparse
+import ast
+import os
+import sys
+import time
+from argparse import Namespace
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from corpus import CORPUS_KINDS, generate_module
+
+from flake8_class_attributes_order import build_ordering_policy
+from flake8_class_attributes_order.imported_names import get_imported_names, resolve_callable_name
+from flake8_class_attributes_order.model_parts_info import (
+    ClassifierContext, ModelPart, get_model_node_type, get_model_parts_info, get_node_name,
+)
+from flake8_class_attributes_order.ordering_policy import get_classifier_context
+
+
+MemberShape = Tuple[Any, ...]
+ClassifiedMember = Tuple[Optional[str], Optional[str]]
+CheckedClasses = List[Tuple[ClassifierContext, ast.ClassDef]]
+
+
+class MemberShapeCache:
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.entries: OrderedDict = OrderedDict()
+
+    def get(self, shape: MemberShape) -> Optional[ClassifiedMember]:
+        classified_member = self.entries.get(shape)
+        if classified_member is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(shape)
+        return classified_member
+
+    def put(self, shape: MemberShape, classified_member: ClassifiedMember) -> None:
+        self.entries[shape] = classified_member
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+
+def get_member_shape(node: ast.AST, imported_names: Mapping[str, str]) -> Optional[MemberShape]:
+    # everything type and name of a member depend on, given the classification rules of a policy
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return (type(node), node.name, *map(get_decorator_name, node.decorator_list))
+    if isinstance(node, (ast.Assign, ast.AnnAssign)):
+        return get_assignment_shape(node, imported_names)
+    return (ast.ClassDef, node.name) if isinstance(node, ast.ClassDef) else None
+
+
+def get_assignment_shape(
+    node: Union[ast.Assign, ast.AnnAssign],
+    imported_names: Mapping[str, str],
+) -> Optional[MemberShape]:
+    target = node.target if isinstance(node, ast.AnnAssign) else node.targets[0]
+    if not isinstance(target, ast.Name):
+        return None
+    value = node.value
+    callable_name = resolve_callable_name(value.func, imported_names) if isinstance(value, ast.Call) else None
+    return type(node), target.id, callable_name
+
+
+def get_decorator_name(decorator_node: ast.AST) -> Tuple[bool, Optional[str]]:
+    # called decorators are matched by configured rules only
+    is_called = isinstance(decorator_node, ast.Call)
+    if isinstance(decorator_node, ast.Call):
+        decorator_node = decorator_node.func
+    if isinstance(decorator_node, ast.Name):
+        return is_called, decorator_node.id
+    return is_called, decorator_node.attr if isinstance(decorator_node, ast.Attribute) else None
+
+
+def get_cached_model_parts_info(
+    model_ast: ast.ClassDef,
+    weights: Mapping[str, int],
+    context: ClassifierContext,
+    member_shape_cache: MemberShapeCache,
+) -> List[ModelPart]:
+    parts_info = []
+    for child_node in model_ast.body:
+        member_shape = get_member_shape(child_node, context.imported_names)
+        classified_member = None if member_shape is None else member_shape_cache.get(member_shape)
+        if classified_member is None:
+            node_type = get_model_node_type(child_node, context)
+            classified_member = node_type, get_node_name(child_node, node_type) if node_type else None
+            if member_shape is not None:
+                member_shape_cache.put(member_shape, classified_member)
+        node_type, node_name = classified_member
+        if node_type and node_type in weights:
+            parts_info.append(ModelPart(
+                model_ast.name, node_name, node_type, weights[node_type], child_node.lineno, child_node.col_offset,
+            ))
+    return parts_info
+
+
+def load_trees(args: Namespace) -> Dict[str, List[ast.Module]]:
+    if not args.paths:
+        return {args.kind: [
+            ast.parse(generate_module(args.kind, args.classes, args.members, seed=file_index))
+            for file_index in range(args.files)
+        ]}
+    trees = []
+    for filename in iter_python_files(args.paths):
+        with open(filename, encoding='utf-8', errors='replace') as source_file:
+            try:
+                trees.append(ast.parse(source_file.read()))
+            except (SyntaxError, ValueError):
+                continue
+    return {'paths': trees}
+
+
+def iter_python_files(paths: Sequence[str]) -> List[str]:
+    filenames = []
+    for path in paths:
+        if os.path.isfile(path):
+            filenames.append(path)
+        for directory, _, names in os.walk(path):
+            filenames.extend(os.path.join(directory, name) for name in sorted(names) if name.endswith('.py'))
+    return filenames
+
+
+def benchmark_shape_cache(trees: Sequence[ast.Module], cache_size: int, repeat: int) -> Dict[str, float]:
+    policy = build_ordering_policy()
+    checked_classes: CheckedClasses = []
+    for tree in trees:
+        context = get_classifier_context(policy, get_imported_names(tree))
+        checked_classes.extend(
+            (context, node) for node in ast.walk(tree) if isinstance(node, ast.ClassDef)
+        )
+    members_count = sum(len(class_def.body) for _, class_def in checked_classes) or 1
+
+    uncached_times, cached_times = [], []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        expected_parts = [
+            get_model_parts_info(class_def, policy.weights, context) for context, class_def in checked_classes
+        ]
+        uncached_times.append(time.perf_counter() - started_at)
+
+        # a fresh cache per run, as a worker process starts with one
+        member_shape_cache = MemberShapeCache(cache_size)
+        started_at = time.perf_counter()
+        cached_parts = [
+            get_cached_model_parts_info(class_def, policy.weights, context, member_shape_cache)
+            for context, class_def in checked_classes
+        ]
+        cached_times.append(time.perf_counter() - started_at)
+        assert cached_parts == expected_parts
+
+    return {
+        'members': members_count,
+        'hit_rate': member_shape_cache.hits / max(member_shape_cache.hits + member_shape_cache.misses, 1),
+        'cached_shapes': len(member_shape_cache.entries),
+        'uncached_ns': min(uncached_times) / members_count * 1e9,
+        'cached_ns': min(cached_times) / members_count * 1e9,
+    }
+
+
+def parse_args(argv: Sequence[str]) -> Namespace:
+    parser = argparse.ArgumentParser(
+        description='Compare classification of class members with and without a cache keyed by member shape',
+    )
+    parser.add_argument('paths', nargs='*', help='Python files or directories to use instead of a synthetic corpus')
+    parser.add_argument('--kind', choices=CORPUS_KINDS, default='django', help='Synthetic corpus kind')
+    parser.add_argument('--files', type=int, default=20, help='Files per corpus')
+    parser.add_argument('--classes', type=int, default=20, help='Classes per file')
+    parser.add_argument('--members', type=int, default=30, help='Members per class')
+    parser.add_argument('--cache-size', type=int, default=4096, help='Member shapes kept in the cache')
+    parser.add_argument('--repeat', type=int, default=5)
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]) -> None:
+    args = parse_args(argv)
+    rows = [f'{"corpus":<10} {"members":>8} {"shapes":>7} {"hits":>6} {"plain ns":>8} {"cached ns":>9} {"change":>7}']
+    for corpus_name, trees in load_trees(args).items():
+        result = benchmark_shape_cache(trees, args.cache_size, args.repeat)
+        rows.append(
+            f'{corpus_name:<10} {result["members"]:>8.0f} {result["cached_shapes"]:>7.0f} {result["hit_rate"]:>6.1%} '
+            f'{result["uncached_ns"]:>8.0f} {result["cached_ns"]:>9.0f} '
+            f'{result["cached_ns"] / result["uncached_ns"] - 1:>+7.1%}',
+        )
+    sys.stdout.write('\n'.join(rows) + '\n')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
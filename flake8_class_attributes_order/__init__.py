@@ -1 +1,4 @@
 __version__ = '0.3.0'
+
+from flake8_class_attributes_order.api import CheckResult, check_sources  # noqa: E402
+from flake8_class_attributes_order.ordering_policy import OrderingPolicy, build_ordering_policy  # noqa: E402
@@ -0,0 +1,7 @@
+import sys
+
+from flake8_class_attributes_order.standalone import main
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+import ast
+from collections import Counter
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from flake8.defaults import NOQA_FILE
+
+from flake8_class_attributes_order.checker import ClassAttributesOrderChecker
+from flake8_class_attributes_order.diff_scope import LineRange
+from flake8_class_attributes_order.exclusions import get_header_lines, is_generated_header, is_inline_ignored
+from flake8_class_attributes_order.ordering_policy import OrderingPolicy, build_ordering_policy
+
+
+Source = Union[str, bytes]
+
+
+class CheckResult(NamedTuple):
+    name: str
+    lineno: int
+    col_offset: int
+    code: str
+    text: str
+
+
+def check_sources(
+    sources: Iterable[Tuple[str, Source]],
+    policy: Optional[OrderingPolicy] = None,
+) -> Iterator[CheckResult]:
+    ordering_policy = policy or build_ordering_policy()
+    for name, source in sources:
+        yield from iter_source_results(name, source, ordering_policy)
+
+
+def iter_source_results(name: str, source: Source, policy: OrderingPolicy) -> Iterator[CheckResult]:
+    lines = (source.decode('utf-8', errors='replace') if isinstance(source, bytes) else source).splitlines()
+    if not policy.disable_noqa and any(NOQA_FILE.match(line) for line in lines):
+        return
+    for lineno, col_offset, message in sorted(get_source_errors(name, source, policy), key=lambda error: error[:2]):
+        if policy.disable_noqa or not is_inline_ignored(message, name, lineno, col_offset, lines):
+            code, text = message.split(' ', 1)
+            yield CheckResult(name, lineno, col_offset, code, text)
+
+
+def get_source_errors(
+    name: str,
+    source: Source,
+    policy: OrderingPolicy,
+    changed_line_ranges: Optional[Sequence[LineRange]] = None,
+    stats: Optional[Counter] = None,
+) -> List[Tuple[int, int, str]]:
+    if policy.generated_markers and is_generated_header(get_header_lines(source), policy.generated_markers):
+        return []
+    try:
+        tree = ast.parse(source, filename=name)
+    except (SyntaxError, ValueError) as error:
+        lineno, col_offset = getattr(error, 'lineno', None) or 1, getattr(error, 'offset', None) or 1
+        return [(lineno, col_offset - 1, f'E999 {type(error).__name__}: {error.args[0]}')]
+    source_text = source.decode('utf-8', errors='replace') if isinstance(source, bytes) else source
+    checker = ClassAttributesOrderChecker(tree, name, source_text.splitlines(keepends=True))
+    checker.ordering_policy = policy
+    checker.changed_line_ranges = changed_line_ranges
+    errors = list(checker.iter_formatted_errors())
+    if stats is not None:
+        stats.update(checker.stats)
+    return errors
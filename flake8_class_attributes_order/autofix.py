@@ -0,0 +1,194 @@
+import ast
+import io
+import logging
+from collections import Counter
+from typing import Callable, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from typing_extensions import Final
+
+from flake8_class_attributes_order.class_discovery import iter_class_defs
+from flake8_class_attributes_order.diff_scope import LineRange, is_class_touched
+from flake8_class_attributes_order.exclusions import filter_excluded_classes
+from flake8_class_attributes_order.imported_names import get_imported_names
+from flake8_class_attributes_order.model_parts_info import ModelPart, get_model_parts_info
+from flake8_class_attributes_order.ordering_errors import OrderingError, iter_ordering_errors
+from flake8_class_attributes_order.ordering_policy import OrderingPolicy, get_classifier_context
+
+
+logger = logging.getLogger(__name__)
+
+UNMOVABLE_NODE_TYPES: Final = frozenset(('expression', 'if'))
+
+MemberSpan = Tuple[int, int]
+ErrorFilter = Callable[[OrderingError], bool]
+
+
+class FixResult(NamedTuple):
+    source: str
+    stats: Counter
+
+
+def fix_source(
+    source: str,
+    policy: OrderingPolicy,
+    changed_line_ranges: Optional[Sequence[LineRange]] = None,
+    is_error_ignored: Optional[ErrorFilter] = None,
+) -> FixResult:
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return FixResult(source, Counter())
+    lines = get_source_lines(source)
+    stats, remaining_errors_count = reorder_classes(tree, lines, policy, changed_line_ranges, is_error_ignored)
+    fixed_source = source
+    if stats['fixed_classes']:
+        reordered_source = ''.join(lines)
+        if is_verified_fix(tree, reordered_source, policy, remaining_errors_count, changed_line_ranges):
+            fixed_source = reordered_source
+            stats['fixed_files'] += 1
+        else:
+            logger.warning('Reordered source does not pass verification, leaving it unchanged')
+            stats = Counter(unfixed_classes=stats['unfixed_classes'] + stats['fixed_classes'])
+    return FixResult(fixed_source, stats)
+
+
+def reorder_classes(
+    tree: ast.AST,
+    lines: List[str],
+    policy: OrderingPolicy,
+    changed_line_ranges: Optional[Sequence[LineRange]] = None,
+    is_error_ignored: Optional[ErrorFilter] = None,
+) -> Tuple[Counter, int]:
+    context = get_classifier_context(policy, get_imported_names(tree))
+    stats: Counter = Counter()
+    remaining_errors_count = 0
+    for class_def in get_class_defs_innermost_first(tree, changed_line_ranges, policy):
+        model_parts_info = get_model_parts_info(class_def, policy.weights, context)
+        errors = get_wrong_order_errors(model_parts_info)
+        member_spans = None
+        if errors and not (is_error_ignored is not None and any(map(is_error_ignored, errors))):
+            member_spans = get_member_spans(class_def, model_parts_info, lines)
+        if member_spans is None and errors:
+            remaining_errors_count += len(errors)
+            stats['unfixed_classes'] += 1
+        elif member_spans is not None:
+            move_member_spans(lines, member_spans, get_target_order(model_parts_info))
+            stats['fixed_classes'] += 1
+    return stats, remaining_errors_count
+
+
+def get_source_lines(source: str) -> List[str]:
+    lines = io.StringIO(source, newline='').readlines()
+    if lines and not lines[-1].endswith(('\n', '\r')):
+        first_line_ending = lines[0][len(lines[0].rstrip('\r\n')):]
+        lines[-1] += first_line_ending or '\n'
+    return lines
+
+
+def get_class_defs_innermost_first(
+    tree: ast.AST,
+    changed_line_ranges: Optional[Sequence[LineRange]] = None,
+    policy: Optional[OrderingPolicy] = None,
+) -> List[ast.ClassDef]:
+    skip_function_scopes = policy is not None and policy.skip_function_scopes
+    class_defs: Iterable[ast.ClassDef] = (
+        class_def for class_def in reversed(list(iter_class_defs(tree, skip_function_scopes)))
+        if changed_line_ranges is None or is_class_touched(class_def, changed_line_ranges)
+    )
+    if policy is not None and (policy.excluded_class_name_re is not None or policy.excluded_base_names):
+        class_defs = filter_excluded_classes(
+            class_defs, policy.excluded_class_name_re, policy.excluded_base_names, get_imported_names(tree), Counter(),
+        )
+    return list(class_defs)
+
+
+def get_wrong_order_errors(model_parts_info: Sequence[ModelPart]) -> List[OrderingError]:
+    return [error for error in iter_ordering_errors(model_parts_info) if error.code == 'CCE001']
+
+
+def get_member_spans(
+    class_def: ast.ClassDef,
+    model_parts_info: Sequence[ModelPart],
+    lines: Sequence[str],
+) -> Optional[List[MemberSpan]]:
+    pinned_count = len(class_def.body) - len(model_parts_info)
+    member_nodes = class_def.body[pinned_count:]
+    if (
+        [(node.lineno, node.col_offset) for node in member_nodes]
+        != [(model_part.lineno, model_part.col_offset) for model_part in model_parts_info]
+        or any(model_part.node_type in UNMOVABLE_NODE_TYPES for model_part in model_parts_info)
+    ):
+        return None
+    previous_end = (class_def.body[pinned_count - 1].end_lineno if pinned_count else None) or class_def.lineno
+    member_spans = []
+    for node in member_nodes:
+        start = get_member_start(node, lines)
+        if start is None or start <= previous_end:
+            return None
+        while start - 1 > previous_end and lines[start - 2].lstrip().startswith('#'):
+            start -= 1
+        previous_end = get_member_end(node, lines)
+        member_spans.append((start, previous_end))
+    return member_spans
+
+
+def get_member_start(node: ast.stmt, lines: Sequence[str]) -> Optional[int]:
+    decorator_list = getattr(node, 'decorator_list', None)
+    if decorator_list:
+        return min(decorator.lineno for decorator in decorator_list)
+    line_prefix = lines[node.lineno - 1].encode()[:node.col_offset]
+    return None if line_prefix.strip() else node.lineno
+
+
+def get_member_end(node: ast.stmt, lines: Sequence[str]) -> int:
+    # comments indented into the member body belong to it, also after its last statement
+    member_end = node.end_lineno or node.lineno
+    for lineno in range(member_end + 1, len(lines) + 1):
+        stripped_line = lines[lineno - 1].lstrip()
+        if not stripped_line:
+            continue
+        if not stripped_line.startswith('#') or len(lines[lineno - 1]) - len(stripped_line) <= node.col_offset:
+            break
+        member_end = lineno
+    return member_end
+
+
+def get_target_order(model_parts_info: Sequence[ModelPart]) -> List[int]:
+    return sorted(range(len(model_parts_info)), key=lambda index: model_parts_info[index].weight)
+
+
+def move_member_spans(lines: List[str], member_spans: Sequence[MemberSpan], target_order: Sequence[int]) -> None:
+    reordered_lines = []
+    for slot, member_index in enumerate(target_order):
+        start, end = member_spans[member_index]
+        reordered_lines.extend(lines[start - 1:end])
+        if slot + 1 < len(member_spans):
+            reordered_lines.extend(lines[member_spans[slot][1]:member_spans[slot + 1][0] - 1])
+    lines[member_spans[0][0] - 1:member_spans[-1][1]] = reordered_lines
+
+
+def is_verified_fix(
+    tree: ast.AST,
+    fixed_source: str,
+    policy: OrderingPolicy,
+    expected_errors_count: int,
+    changed_line_ranges: Optional[Sequence[LineRange]] = None,
+) -> bool:
+    try:
+        fixed_tree = ast.parse(fixed_source)
+    except (SyntaxError, ValueError):
+        return False
+    context = get_classifier_context(policy, get_imported_names(fixed_tree))
+    errors_count = sum(
+        len(get_wrong_order_errors(get_model_parts_info(class_def, policy.weights, context)))
+        for class_def in get_class_defs_innermost_first(fixed_tree, changed_line_ranges, policy)
+    )
+    if errors_count != expected_errors_count:
+        return False
+    return dump_with_sorted_class_bodies(tree) == dump_with_sorted_class_bodies(fixed_tree)
+
+
+def dump_with_sorted_class_bodies(tree: ast.AST) -> str:
+    for class_def in get_class_defs_innermost_first(tree):
+        class_def.body.sort(key=ast.dump)
+    return ast.dump(tree)
@@ -0,0 +1,98 @@
+import ast
+import hashlib
+import os
+import warnings
+from collections import Counter
+from typing import Iterable, Iterator, List, Mapping, NamedTuple, Tuple
+
+from typing_extensions import Final
+
+from flake8_class_attributes_order.class_discovery import get_class_qualname
+from flake8_class_attributes_order.ordering_errors import OrderingError
+
+
+BaselineKey = Tuple[str, str, str]
+BaselineEntry = Tuple[str, str, str, str]
+
+BASELINE_HEADER: Final = '# flake8-class-attributes-order baseline v1\n'
+
+
+class Baseline(NamedTuple):
+    directory: str
+    digest: str
+    # entries of each file are kept unparsed until the file is checked
+    file_entries: Mapping[str, str]
+
+
+def load_baseline(baseline_path: str) -> Baseline:
+    directory = os.path.dirname(os.path.abspath(baseline_path))
+    try:
+        with open(baseline_path, encoding='utf-8') as baseline_file:
+            baseline_text = baseline_file.read()
+    except OSError as error:
+        warnings.warn(f'Baseline {baseline_path} is not loaded: {error}', Warning)  # noqa: B028
+        return Baseline(directory, '', {})
+    if not baseline_text.startswith(BASELINE_HEADER):
+        warnings.warn(f'Baseline {baseline_path} is not loaded: unknown format', Warning)  # noqa: B028
+        return Baseline(directory, '', {})
+    return parse_baseline(baseline_text, directory)
+
+
+def parse_baseline(baseline_text: str, directory: str) -> Baseline:
+    file_entries = {}
+    for file_block in baseline_text[len(BASELINE_HEADER):].split('\n\n'):
+        path, _, entries = file_block.strip('\n').partition('\n')
+        if path:
+            file_entries[path] = entries
+    return Baseline(directory, hashlib.sha256(baseline_text.encode()).hexdigest(), file_entries)
+
+
+def get_file_baseline(baseline: Baseline, filename: str) -> Counter:
+    entries = baseline.file_entries.get(get_baseline_path(filename, baseline.directory))
+    if not entries:
+        return Counter()
+    return Counter(tuple(entry.split('\t')) for entry in entries.splitlines())
+
+
+def get_baseline_path(filename: str, directory: str) -> str:
+    return os.path.relpath(os.path.abspath(filename), directory).replace(os.sep, '/')
+
+
+def get_baseline_key(error: OrderingError, qualname: str) -> BaselineKey:
+    return qualname, error.model_parts_info[error.part_index].name or '', error.code
+
+
+def iter_unbaselined_errors(
+    errors: Iterable[OrderingError],
+    tree: ast.AST,
+    class_def: ast.ClassDef,
+    file_baseline: Counter,
+    matched_counts: Counter,
+    stats: Counter,
+) -> Iterator[OrderingError]:
+    qualname = None
+    for error in errors:
+        if qualname is None:
+            qualname = get_class_qualname(tree, class_def)
+        baseline_key = get_baseline_key(error, qualname)
+        if matched_counts[baseline_key] < file_baseline[baseline_key]:
+            matched_counts[baseline_key] += 1
+            stats['baselined_errors'] += 1
+        else:
+            yield error
+
+
+def format_baseline(entries: Iterable[BaselineEntry]) -> str:
+    file_blocks: List[str] = []
+    current_path = None
+    for path, *baseline_key in sorted(entries):
+        if path != current_path:
+            file_blocks.append(f'\n{path}\n')
+            current_path = path
+        file_blocks.append('\t'.join(baseline_key) + '\n')
+    return BASELINE_HEADER + ''.join(file_blocks)
+
+
+def write_baseline(baseline_path: str, entries: Iterable[BaselineEntry]) -> None:
+    with open(baseline_path, 'w', encoding='utf-8') as baseline_file:
+        baseline_file.write(format_baseline(entries))
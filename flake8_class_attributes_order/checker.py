@@ -1,10 +1,41 @@
 import ast
-from typing import Generator, Tuple, List
+from argparse import Namespace
+from collections import Counter
+from functools import cached_property
+from itertools import islice
+from types import MappingProxyType
+from typing import AbstractSet, Dict, Generator, Iterable, Iterator, Tuple, List, Mapping, Optional, Sequence
+
+from typing_extensions import Final
 
 from flake8_class_attributes_order import __version__ as version
-from flake8_class_attributes_order.node_type_weights import get_node_weights
-from flake8_class_attributes_order.model_parts_info import get_model_parts_info
-from flake8_class_attributes_order.ordering_errors import get_ordering_errors
+from flake8_class_attributes_order.baseline import (
+    BaselineEntry, get_baseline_key, get_baseline_path, get_file_baseline, iter_unbaselined_errors,
+)
+from flake8_class_attributes_order.class_discovery import get_class_qualname, iter_class_defs
+from flake8_class_attributes_order.diff_scope import LineRange, is_class_touched
+from flake8_class_attributes_order.exclusions import (
+    filter_excluded_classes, filter_inline_ignored_errors, get_noqa_linenos, is_generated_header,
+)
+from flake8_class_attributes_order.imported_names import get_imported_names
+from flake8_class_attributes_order.model_parts_info import ModelPart, get_model_parts_info
+from flake8_class_attributes_order.ordering_errors import (
+    OrderingError, format_ordering_error, iter_minimal_move_errors, iter_ordering_errors,
+)
+from flake8_class_attributes_order.ordering_policy import (
+    DEFAULT_REPORT_MODE, REPORT_MODES, OrderingPolicy, are_all_codes_disabled, get_classifier_context,
+    get_file_disabled_codes, get_file_results_digest, get_ordering_policy,
+)
+from flake8_class_attributes_order.profiling import (
+    PROFILE_ENV_VARIABLE, Profiler, get_phase, get_profile_path, get_profiler, reset_profile,
+)
+from flake8_class_attributes_order.result_cache import DEFAULT_CACHE_SIZE_MB, get_cache_key, get_result_cache
+
+
+ERRORS_ITERATORS_BY_REPORT_MODE: Final = MappingProxyType({
+    'adjacent': iter_ordering_errors,
+    'minimal-moves': iter_minimal_move_errors,
+})
 
 
 class ClassAttributesOrderChecker:
@@ -12,13 +43,63 @@ class ClassAttributesOrderChecker:
     name = 'flake8-class-attributes-order'
     version = version
     options = None
+    ordering_policy: OrderingPolicy
+    changed_line_ranges: Optional[Sequence[LineRange]] = None
+    profile_path: Optional[str] = None
 
-    def __init__(self, tree, filename: str):
+    def __init__(self, tree, filename: str, lines: Optional[List[str]] = None):
         self.filename = filename
         self.tree = tree
+        self.lines = lines
+        self.stats: Counter = Counter()
+
+    @cached_property
+    def disabled_codes(self) -> AbstractSet[str]:
+        return get_file_disabled_codes(self.ordering_policy, self.filename)
 
     @classmethod
     def add_options(cls, parser) -> None:
+        cls.add_ordering_options(parser)
+        cls.add_scope_options(parser)
+        parser.add_option(
+            '--class-attributes-order-cache-dir',
+            parse_from_config=True,
+            help='Directory for persistent cache of check results (disabled by default)',
+        )
+        parser.add_option(
+            '--class-attributes-order-cache-size',
+            type=int,
+            default=DEFAULT_CACHE_SIZE_MB,
+            parse_from_config=True,
+            help='Maximum size of results cache in megabytes (default: %(default)s)',
+        )
+        parser.add_option(
+            '--class-attributes-order-max-errors-per-class',
+            type=int,
+            parse_from_config=True,
+            help='Report at most this many errors for each class',
+        )
+        parser.add_option(
+            '--class-attributes-order-max-errors-per-file',
+            type=int,
+            parse_from_config=True,
+            help='Report at most this many errors for each file',
+        )
+        parser.add_option(
+            '--class-attributes-order-fail-fast',
+            action='store_true',
+            parse_from_config=True,
+            help='Stop checking a file after the first wrong attributes order error',
+        )
+        parser.add_option(
+            '--class-attributes-order-profile',
+            parse_from_config=True,
+            help='Write per-phase timings and counters as JSON to this file '
+                 f'(also enabled by {PROFILE_ENV_VARIABLE} environment variable)',
+        )
+
+    @classmethod
+    def add_ordering_options(cls, parser) -> None:
         parser.add_option(
             '--use-class-attributes-order-strict-mode',
             action='store_true',
@@ -38,19 +119,213 @@ class ClassAttributesOrderChecker:
             parse_from_config=True,
             help='Ignore docstring errors whenever they appear',
         )
+        parser.add_option(
+            '--class-attributes-order-outer-fields',
+            comma_separated_list=True,
+            parse_from_config=True,
+            help='Comma-separated list of callable names that define '
+                 'outer_field attributes (ForeignKey, ManyToManyField, etc.)',
+        )
+        parser.add_option(
+            '--class-attributes-order-decorator-types',
+            comma_separated_list=True,
+            parse_from_config=True,
+            help='Comma-separated list of decorator_name:node_type rules, e.g. '
+                 'hybrid_property:property_method, abstractmethod:method',
+        )
+        parser.add_option(
+            '--class-attributes-order-method-types',
+            comma_separated_list=True,
+            parse_from_config=True,
+            help='Comma-separated list of method_name:node_type rules, e.g. setUp:__init__',
+        )
+        parser.add_option(
+            '--class-attributes-order-report-mode',
+            choices=REPORT_MODES,
+            default=DEFAULT_REPORT_MODE,
+            parse_from_config=True,
+            help='How to report wrong order: every adjacent inversion or only members '
+                 'that have to be moved (default: %(default)s)',
+        )
 
     @classmethod
-    def parse_options(cls, options: str) -> None:
+    def add_scope_options(cls, parser) -> None:
+        parser.add_option(
+            '--class-attributes-order-generated-markers',
+            comma_separated_list=True,
+            parse_from_config=True,
+            help='Comma-separated list of markers (e.g. @generated) that skip a file '
+                 'when found in its first lines',
+        )
+        parser.add_option(
+            '--class-attributes-order-exclude-classes',
+            comma_separated_list=True,
+            parse_from_config=True,
+            help='Comma-separated list of regular expressions for names of classes to skip',
+        )
+        parser.add_option(
+            '--class-attributes-order-exclude-bases',
+            comma_separated_list=True,
+            parse_from_config=True,
+            help='Comma-separated list of base class names whose subclasses are skipped',
+        )
+        parser.add_option(
+            '--class-attributes-order-baseline',
+            parse_from_config=True,
+            help='Do not report errors listed in this baseline file',
+        )
+        parser.add_option(
+            '--class-attributes-order-skip-function-scopes',
+            action='store_true',
+            parse_from_config=True,
+            help='Check only module level classes and classes nested in them, skipping classes defined in functions',
+        )
+
+    @classmethod
+    def parse_options(cls, options: Namespace) -> None:
         cls.options = options
+        cls.profile_path = get_profile_path(options)
+        reset_profile(cls.profile_path)
+        with get_phase(get_profiler(cls.profile_path), 'get_node_weights'):
+            cls.ordering_policy = get_ordering_policy(options)
 
     def run(self) -> Generator[Tuple[int, int, str, type], None, None]:
-        weight_info = get_node_weights(self.options)
-        classes = [n for n in ast.walk(self.tree) if isinstance(n, ast.ClassDef)]
-        errors: List[Tuple[int, int, str]] = []
+        try:
+            for lineno, col_offset, error_msg in self.iter_run_errors():
+                yield lineno, col_offset, error_msg, type(self)
+        finally:
+            self.count_stats()
+
+    def iter_run_errors(self) -> Iterator[Tuple[int, int, str]]:
+        if are_all_codes_disabled(self.ordering_policy, self.filename):
+            self.stats['disabled_files'] += 1
+            return
+        generated_markers = self.ordering_policy.generated_markers
+        if generated_markers and self.lines is not None and is_generated_header(self.lines, generated_markers):
+            self.stats['generated_files'] += 1
+            return
+        result_cache = get_result_cache(self.options)
+        if result_cache is None or self.lines is None or self.changed_line_ranges is not None:
+            errors: Iterable[Tuple[int, int, str]] = self.iter_formatted_errors()
+        else:
+            cache_key = get_cache_key(
+                ''.join(self.lines).encode(), get_file_results_digest(self.ordering_policy, self.filename),
+            )
+            cached_errors = result_cache.load(cache_key)
+            if cached_errors is None:
+                cached_errors = list(self.iter_formatted_errors())
+                result_cache.store(cache_key, cached_errors)
+            errors = cached_errors
+        yield from errors
+
+    def count_stats(self) -> None:
+        # flake8 has no run stats output, so skipped files and classes are counted by the profiler
+        profiler = get_profiler(self.profile_path)
+        if profiler is not None:
+            for stat_name, stat_value in self.stats.items():
+                profiler.count(stat_name, stat_value)
+
+    def iter_formatted_errors(self) -> Iterator[Tuple[int, int, str]]:
+        profiler = get_profiler(self.profile_path)
+        formatted_errors = map(format_ordering_error, self.iter_errors())
+        return formatted_errors if profiler is None else profiler.timed_iter('format_messages', formatted_errors)
+
+    def iter_errors(self) -> Iterator[OrderingError]:
+        max_errors_per_file = self.ordering_policy.max_errors_per_file
+        errors = self.iter_classes_errors()
+        return islice(errors, max_errors_per_file) if max_errors_per_file else errors
+
+    def iter_classes_errors(self) -> Iterator[OrderingError]:
+        return (error for _, error in self.iter_class_def_errors())
+
+    def iter_class_def_errors(self) -> Iterator[Tuple[ast.ClassDef, OrderingError]]:
+        profiler = get_profiler(self.profile_path)
+        weight_info = self.ordering_policy.weights
+        max_errors_per_class = self.ordering_policy.max_errors_per_class
+        iter_class_errors = ERRORS_ITERATORS_BY_REPORT_MODE[self.ordering_policy.report_mode]
+        classifier_context = get_classifier_context(self.ordering_policy, get_imported_names(self.tree))
+        baseline = self.ordering_policy.baseline
+        file_baseline = get_file_baseline(baseline, self.filename) if baseline is not None else Counter()
+        baselined_counts: Counter = Counter()
+        # inline ignores are applied before limits, so suppressed errors do not use them up
+        noqa_linenos = (
+            get_noqa_linenos(self.lines) if self.lines is not None and not self.ordering_policy.disable_noqa
+            else frozenset()
+        )
+
+        for class_def in self.iter_class_defs(classifier_context.imported_names, profiler):
+            with get_phase(profiler, 'get_model_parts_info'):
+                model_parts_info = get_model_parts_info(class_def, weight_info, classifier_context)
+            class_errors = self.filter_reported_errors(
+                class_def, iter_class_errors(model_parts_info), file_baseline, baselined_counts, noqa_linenos,
+            )
+            if max_errors_per_class:
+                class_errors = islice(class_errors, max_errors_per_class)
+            if profiler is not None:
+                class_errors = profile_class_errors(profiler, model_parts_info, class_errors)
+            for error in class_errors:
+                yield class_def, error
+                if self.ordering_policy.fail_fast and error.code == 'CCE001':
+                    return
+
+    def filter_reported_errors(
+        self,
+        class_def: ast.ClassDef,
+        class_errors: Iterator[OrderingError],
+        file_baseline: Counter,
+        baselined_counts: Counter,
+        noqa_linenos: AbstractSet[int],
+    ) -> Iterator[OrderingError]:
+        disabled_codes = self.disabled_codes
+        if disabled_codes:
+            class_errors = (error for error in class_errors if error.code not in disabled_codes)
+        if noqa_linenos:
+            class_errors = filter_inline_ignored_errors(class_errors, self.filename, self.lines or [], noqa_linenos)
+        if file_baseline:
+            class_errors = iter_unbaselined_errors(
+                class_errors, self.tree, class_def, file_baseline, baselined_counts, self.stats,
+            )
+        return class_errors
+
+    def iter_baseline_entries(self, baseline_directory: str) -> Iterator[BaselineEntry]:
+        baseline_path = get_baseline_path(self.filename, baseline_directory)
+        for qualname, error in self.iter_qualified_errors():
+            yield (baseline_path, *get_baseline_key(error, qualname))
+
+    def iter_qualified_errors(self) -> Iterator[Tuple[str, OrderingError]]:
+        class_qualnames: Dict[ast.ClassDef, str] = {}
+        for class_def, error in self.iter_class_def_errors():
+            if class_def not in class_qualnames:
+                class_qualnames[class_def] = get_class_qualname(self.tree, class_def)
+            yield class_qualnames[class_def], error
+
+    def iter_class_defs(
+        self,
+        imported_names: Mapping[str, str],
+        profiler: Optional[Profiler] = None,
+    ) -> Iterator[ast.ClassDef]:
+        policy = self.ordering_policy
+        class_defs: Iterator[ast.ClassDef] = (
+            class_def for class_def in iter_class_defs(self.tree, policy.skip_function_scopes)
+            if self.changed_line_ranges is None or is_class_touched(class_def, self.changed_line_ranges)
+        )
+        if policy.excluded_class_name_re is not None or policy.excluded_base_names:
+            class_defs = filter_excluded_classes(
+                class_defs, policy.excluded_class_name_re, policy.excluded_base_names, imported_names, self.stats,
+            )
+        if profiler is None:
+            return class_defs
+        profiler.count('files')
+        return profiler.timed_iter('class_discovery', class_defs)
 
-        for class_def in classes:
-            model_parts_info = get_model_parts_info(class_def, weight_info)
-            errors += get_ordering_errors(model_parts_info)
 
-        for lineno, col_offset, error_msg in errors:
-            yield lineno, col_offset, error_msg, type(self)
+def profile_class_errors(
+    profiler: Profiler,
+    model_parts_info: Sequence[ModelPart],
+    class_errors: Iterator[OrderingError],
+) -> Iterator[OrderingError]:
+    profiler.count('classes')
+    profiler.count('members', len(model_parts_info))
+    for error in profiler.timed_iter('get_ordering_errors', class_errors):
+        profiler.count('errors')
+        yield error
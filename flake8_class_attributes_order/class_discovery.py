@@ -0,0 +1,50 @@
+import ast
+from bisect import bisect_right
+from collections import deque
+from typing import Iterator, List, Tuple
+
+from typing_extensions import Deque, Final
+
+
+# expressions never contain class definitions, so only statement blocks are traversed
+STATEMENT_BLOCK_FIELDS: Final = ('body', 'handlers', 'orelse', 'finalbody', 'cases')
+
+FUNCTION_DEF_TYPES: Final = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def iter_class_defs(tree: ast.AST, skip_function_scopes: bool = False) -> Iterator[ast.ClassDef]:
+    nodes: Deque[ast.AST] = deque([tree])
+    while nodes:
+        node = nodes.popleft()
+        if isinstance(node, ast.ClassDef):
+            yield node
+        elif skip_function_scopes and isinstance(node, FUNCTION_DEF_TYPES):
+            continue
+        for field_name in STATEMENT_BLOCK_FIELDS:
+            nodes.extend(getattr(node, field_name, ()))
+
+
+def get_class_qualname(tree: ast.AST, class_def: ast.ClassDef) -> str:
+    # descends only through statements enclosing the class, found by their start positions
+    class_position = (class_def.lineno, class_def.col_offset)
+    scope_names: List[str] = []
+    block_nodes: List[ast.AST] = list(getattr(tree, 'body', ()))
+    while block_nodes:
+        node_positions = [get_node_position(node) for node in block_nodes]
+        node = block_nodes[max(bisect_right(node_positions, class_position) - 1, 0)]
+        if node is class_def:
+            break
+        if isinstance(node, ast.ClassDef):
+            scope_names.append(node.name)
+        elif isinstance(node, FUNCTION_DEF_TYPES):
+            scope_names.extend((node.name, '<locals>'))
+        block_nodes = [
+            child_node for field_name in STATEMENT_BLOCK_FIELDS for child_node in getattr(node, field_name, ())
+        ]
+    return '.'.join([*scope_names, class_def.name])
+
+
+def get_node_position(node) -> Tuple[int, int]:
+    # match_case has no position, its pattern has
+    position_node = getattr(node, 'pattern', node)
+    return position_node.lineno, position_node.col_offset
@@ -0,0 +1,145 @@
+import argparse
+import errno
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional
+
+from flake8_class_attributes_order.ordering_policy import get_ordering_policy
+from flake8_class_attributes_order.standalone import check_source
+
+
+DEFAULT_IDLE_TIMEOUT = 600
+
+
+class CheckRequestHandler(socketserver.StreamRequestHandler):
+
+    server: 'CheckerServer'
+
+    def handle(self) -> None:
+        for request_line in self.rfile:
+            self.server.touch()
+            if not request_line.strip():
+                continue
+            try:
+                response = self.server.handle_check_request(json.loads(request_line))
+            except (OSError, KeyError, ValueError, TypeError) as error:
+                response = {'error': f'{type(error).__name__}: {error}'}
+            self.wfile.write(json.dumps(response).encode() + b'\n')
+            self.wfile.flush()
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.connection_opened()
+
+    def finish(self) -> None:
+        self.server.connection_closed()
+        super().finish()
+
+
+class CheckerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, base_options: argparse.Namespace, idle_timeout: float):
+        super().__init__(socket_path, CheckRequestHandler)
+        self.base_options = base_options
+        self.idle_timeout = idle_timeout
+        self.active_connections = 0
+        self.last_activity = time.monotonic()
+        self.activity_lock = threading.Lock()
+        get_ordering_policy(base_options)
+
+    def serve_until_idle(self) -> None:
+        self.timeout = min(1.0, self.idle_timeout)
+        while not self.is_idle():
+            self.handle_request()
+
+    def is_idle(self) -> bool:
+        with self.activity_lock:
+            return not self.active_connections and time.monotonic() - self.last_activity > self.idle_timeout
+
+    def touch(self) -> None:
+        with self.activity_lock:
+            self.last_activity = time.monotonic()
+
+    def connection_opened(self) -> None:
+        with self.activity_lock:
+            self.active_connections += 1
+            self.last_activity = time.monotonic()
+
+    def connection_closed(self) -> None:
+        with self.activity_lock:
+            self.active_connections -= 1
+            self.last_activity = time.monotonic()
+
+    def handle_check_request(self, request: Mapping[str, Any]) -> Dict[str, Any]:
+        filename = request['path']
+        source = request.get('source')
+        if source is None:
+            with open(filename, 'rb') as file_handler:
+                source_bytes = file_handler.read()
+        else:
+            source_bytes = source.encode()
+        options = self.get_request_options(request.get('options') or {})
+        errors = check_source(source_bytes, filename, options=options)
+        return {
+            'path': filename,
+            'diagnostics': [
+                {'line': lineno, 'column': col_offset + 1, 'code': message.split(' ', 1)[0], 'message': message}
+                for lineno, col_offset, message in errors
+            ],
+        }
+
+    def get_request_options(self, request_options: Mapping[str, Any]) -> argparse.Namespace:
+        options = argparse.Namespace(**vars(self.base_options))
+        for option_name, option_value in request_options.items():
+            if not hasattr(options, option_name):
+                raise ValueError(f'Unknown option: {option_name}')
+            setattr(options, option_name, option_value)
+        return options
+
+
+def serve(socket_path: str, base_options: argparse.Namespace, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+    if os.path.exists(socket_path):
+        if not is_stale_socket(socket_path):
+            raise FileExistsError(errno.EEXIST, 'Path is used by a running daemon or is not a socket', socket_path)
+        os.unlink(socket_path)
+    with CheckerServer(socket_path, base_options, idle_timeout) as server:
+        try:
+            server.serve_until_idle()
+        finally:
+            os.unlink(socket_path)
+
+
+def is_stale_socket(socket_path: str) -> bool:
+    if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+        try:
+            client_socket.connect(socket_path)
+        except ConnectionRefusedError:
+            return True
+    return False
+
+
+def request_check(
+    socket_path: str,
+    path: str,
+    source: Optional[str] = None,
+    options: Optional[Mapping[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    request = {'path': path, 'source': source, 'options': dict(options or {})}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+        client_socket.connect(socket_path)
+        with client_socket.makefile('rwb') as socket_file:
+            socket_file.write(json.dumps(request).encode() + b'\n')
+            socket_file.flush()
+            response = json.loads(socket_file.readline())
+    if 'error' in response:
+        raise ValueError(response['error'])
+    return response['diagnostics']
@@ -0,0 +1,63 @@
+import ast
+import os
+import re
+import subprocess
+from typing import Dict, List, Sequence, Tuple
+
+from typing_extensions import Final
+
+
+LineRange = Tuple[int, int]
+
+HUNK_HEADER_RE: Final = re.compile(
+    r'^@@ -\d+(?:,(?P<old_count>\d+))? \+(?P<start>\d+)(?:,(?P<count>\d+))? @@',
+)
+
+
+def parse_unified_diff(diff_text: str) -> Dict[str, List[LineRange]]:
+    changed_line_ranges: Dict[str, List[LineRange]] = {}
+    current_ranges: List[LineRange] = []
+    # lines left in the current hunk, so added lines starting with '++ ' are not taken for file headers
+    old_remaining, new_remaining = 0, 0
+    for line in diff_text.splitlines():
+        if old_remaining > 0 or new_remaining > 0:
+            old_remaining -= not line.startswith(('+', '\\'))
+            new_remaining -= not line.startswith(('-', '\\'))
+            continue
+        if line.startswith('+++ '):
+            current_ranges = []
+            target_path = line[4:].split('\t', 1)[0].strip()
+            if target_path != '/dev/null':
+                target_path = target_path[2:] if target_path.startswith('b/') else target_path
+                current_ranges = changed_line_ranges.setdefault(normalize_path(target_path), [])
+            continue
+        hunk_header_match = HUNK_HEADER_RE.match(line)
+        if hunk_header_match:
+            start = int(hunk_header_match.group('start'))
+            count = int(hunk_header_match.group('count') or 1)
+            range_start = max(start, 1)
+            current_ranges.append((range_start, start + count if count else range_start + 1))
+            old_remaining, new_remaining = int(hunk_header_match.group('old_count') or 1), count
+    return changed_line_ranges
+
+
+def get_git_diff(revision_range: str) -> str:
+    return subprocess.run(
+        ['git', 'diff', '--relative', '--no-color', '--no-ext-diff', '-U0', revision_range, '--'],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def normalize_path(path: str) -> str:
+    return os.path.relpath(os.path.normpath(path))
+
+
+def is_class_touched(class_def: ast.ClassDef, changed_line_ranges: Sequence[LineRange]) -> bool:
+    class_start = min([class_def.lineno] + [decorator.lineno for decorator in class_def.decorator_list])
+    class_end = class_def.end_lineno or class_def.lineno
+    return any(
+        range_start <= class_end and class_start < range_end
+        for range_start, range_end in changed_line_ranges
+    )
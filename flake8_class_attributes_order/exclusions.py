@@ -0,0 +1,82 @@
+import ast
+from collections import Counter
+from typing import AbstractSet, Iterable, Iterator, List, Mapping, Optional, Pattern, Sequence, Union
+
+from flake8.violation import Violation
+from typing_extensions import Final
+
+from flake8_class_attributes_order.imported_names import resolve_callable_name
+from flake8_class_attributes_order.ordering_errors import OrderingError
+
+
+GENERATED_HEADER_LINES: Final = 10
+GENERATED_HEADER_SIZE: Final = 4096
+
+
+def get_header_lines(source: Union[str, bytes]) -> List[str]:
+    header = source[:GENERATED_HEADER_SIZE]
+    header_text = header.decode('utf-8', errors='replace') if isinstance(header, bytes) else header
+    return header_text.splitlines()[:GENERATED_HEADER_LINES]
+
+
+def is_generated_header(header_lines: Sequence[str], generated_markers: Sequence[str]) -> bool:
+    return any(marker in line for line in header_lines[:GENERATED_HEADER_LINES] for marker in generated_markers)
+
+
+def filter_excluded_classes(
+    class_defs: Iterable[ast.ClassDef],
+    excluded_name_re: Optional[Pattern[str]],
+    excluded_base_names: AbstractSet[str],
+    imported_names: Mapping[str, str],
+    stats: Counter,
+) -> Iterator[ast.ClassDef]:
+    for class_def in class_defs:
+        if is_class_excluded(class_def, excluded_name_re, excluded_base_names, imported_names):
+            stats['excluded_classes'] += 1
+        else:
+            yield class_def
+
+
+def is_class_excluded(
+    class_def: ast.ClassDef,
+    excluded_name_re: Optional[Pattern[str]],
+    excluded_base_names: AbstractSet[str],
+    imported_names: Mapping[str, str],
+) -> bool:
+    if excluded_name_re is not None and excluded_name_re.fullmatch(class_def.name):
+        return True
+    return bool(excluded_base_names) and any(
+        resolve_callable_name(base.value if isinstance(base, ast.Subscript) else base, imported_names)
+        in excluded_base_names
+        for base in class_def.bases
+    )
+
+
+def is_inline_ignored(
+    message: str,
+    filename: str,
+    lineno: int,
+    col_offset: int,
+    lines: Sequence[str],
+) -> bool:
+    code, text = message.split(' ', 1)
+    physical_line = lines[lineno - 1] if lineno <= len(lines) else ''
+    violation = Violation(code, filename, lineno, col_offset + 1, text, physical_line)
+    return violation.is_inline_ignored(disable_noqa=False)
+
+
+def get_noqa_linenos(lines: Sequence[str]) -> AbstractSet[int]:
+    return frozenset(lineno for lineno, line in enumerate(lines, 1) if 'noqa' in line.lower())
+
+
+def filter_inline_ignored_errors(
+    errors: Iterable[OrderingError],
+    filename: str,
+    lines: Sequence[str],
+    noqa_linenos: AbstractSet[int],
+) -> Iterator[OrderingError]:
+    return (
+        error for error in errors
+        if error.lineno not in noqa_linenos
+        or not is_inline_ignored(f'{error.code} ', filename, error.lineno, error.col_offset, lines)
+    )
@@ -0,0 +1,40 @@
+import ast
+from typing import Dict, Iterable, Mapping, Union
+
+
+IMPORT_SCOPE_FIELDS = ('body', 'handlers', 'orelse', 'finalbody')
+IMPORT_SCOPE_NODE_TYPES = (ast.If, ast.Try, ast.ExceptHandler, ast.With) + (
+    (ast.TryStar,) if hasattr(ast, 'TryStar') else ()  # type: ignore
+)
+
+
+def get_imported_names(tree: ast.AST) -> Dict[str, str]:
+    imported_names: Dict[str, str] = {}
+    for import_node in iter_module_level_imports(getattr(tree, 'body', [])):
+        if isinstance(import_node, ast.ImportFrom):
+            module_prefix = f'{import_node.module}.' if import_node.module else ''
+            for alias in import_node.names:
+                if alias.name != '*':
+                    imported_names[alias.asname or alias.name] = f'{module_prefix}{alias.name}'
+        else:
+            for alias in import_node.names:
+                if alias.asname:
+                    imported_names[alias.asname] = alias.name
+    return imported_names
+
+
+def iter_module_level_imports(statements: Iterable[ast.AST]) -> Iterable[Union[ast.Import, ast.ImportFrom]]:
+    for statement in statements:
+        if isinstance(statement, (ast.Import, ast.ImportFrom)):
+            yield statement
+        elif isinstance(statement, IMPORT_SCOPE_NODE_TYPES):
+            for field_name in IMPORT_SCOPE_FIELDS:
+                yield from iter_module_level_imports(getattr(statement, field_name, []))
+
+
+def resolve_callable_name(func_node: ast.AST, imported_names: Mapping[str, str]) -> str:
+    if isinstance(func_node, ast.Attribute):
+        return func_node.attr
+    if isinstance(func_node, ast.Name):
+        return imported_names.get(func_node.id, func_node.id).rsplit('.', 1)[-1]
+    return ''
@@ -1,119 +1,196 @@
 import ast
-from typing import Dict, Mapping, Optional, Set, Union
+from types import MappingProxyType
+from typing import AbstractSet, Any, Callable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
 
+from typing_extensions import Final
 
-def get_model_parts_info(model_ast, weights: Mapping[str, int]):
+from flake8_class_attributes_order.imported_names import resolve_callable_name
+from flake8_class_attributes_order.node_type_weights import STRICT_NODE_TYPE_WEIGHTS
+
+
+NodeTypeGetter = Callable[[Any, 'ClassifierContext'], Optional[str]]
+FuncdefTypes = Tuple[str, str, str]
+NameGetter = Callable[[Any], str]
+TypePostfix = Union[str, Tuple[str, ...]]
+
+SPECIAL_METHODS_NAMES: Final[AbstractSet[str]] = frozenset((
+    '__new__',
+    '__init__',
+    '__post_init__',
+    '__str__',
+    'save',
+    'delete',
+))
+
+DECORATOR_NAMES_TO_TYPES_MAP: Final[Mapping[str, str]] = MappingProxyType({
+    'property': 'property_method',
+    'cached_property': 'property_method',
+    'setter': 'property_method',
+    'deleter': 'property_method',
+    'staticmethod': 'static_method',
+    'classmethod': 'class_method',
+
+    'protected_property': 'protected_property_method',
+    'protected_cached_property': 'protected_property_method',
+    'protected_setter': 'protected_property_method',
+    'protected_deleter': 'protected_property_method',
+    'protected_staticmethod': 'protected_static_method',
+    'protected_classmethod': 'protected_class_method',
+
+    'private_property': 'private_property_method',
+    'private_cached_property': 'private_property_method',
+    'private_setter': 'private_property_method',
+    'private_deleter': 'private_property_method',
+    'private_staticmethod': 'private_static_method',
+    'private_classmethod': 'private_class_method',
+})
+
+OUTER_FIELD_CALLABLE_NAMES: Final[AbstractSet[str]] = frozenset((
+    'ForeignKey',
+    'ManyToManyField',
+    'OneToOneField',
+    'GenericRelation',
+    'GenericForeignKey',
+))
+
+
+def compile_decorator_types(decorator_names_to_types: Mapping[str, str]) -> Mapping[str, FuncdefTypes]:
+    return MappingProxyType({
+        decorator_name: (
+            node_type,
+            get_visibility_node_type('protected', node_type),
+            get_visibility_node_type('private', node_type),
+        )
+        for decorator_name, node_type in decorator_names_to_types.items()
+    })
+
+
+def get_visibility_node_type(visibility: str, node_type: str) -> str:
+    visibility_node_type = f'{visibility}_{node_type}'
+    return visibility_node_type if visibility_node_type in STRICT_NODE_TYPE_WEIGHTS else node_type
+
+
+DEFAULT_DECORATOR_TYPES: Final = compile_decorator_types({
+    decorator_name: node_type for decorator_name, node_type in DECORATOR_NAMES_TO_TYPES_MAP.items()
+    if not decorator_name.startswith(('protected_', 'private_'))
+})
+
+DEFAULT_METHOD_NAME_TYPES: Final[Mapping[str, str]] = MappingProxyType({
+    method_name: method_name for method_name in SPECIAL_METHODS_NAMES
+})
+
+
+class ClassifierContext(NamedTuple):
+    imported_names: Mapping[str, str]
+    outer_field_callable_names: AbstractSet[str]
+    decorator_types: Mapping[str, FuncdefTypes]
+    called_decorator_types: Mapping[str, FuncdefTypes]
+    method_name_types: Mapping[str, str]
+
+
+DEFAULT_CLASSIFIER_CONTEXT: Final = ClassifierContext(
+    MappingProxyType({}),
+    OUTER_FIELD_CALLABLE_NAMES,
+    DEFAULT_DECORATOR_TYPES,
+    MappingProxyType({}),
+    DEFAULT_METHOD_NAME_TYPES,
+)
+
+
+class ModelPart(NamedTuple):
+    model_name: str
+    name: Optional[str]
+    node_type: str
+    weight: int
+    lineno: int
+    col_offset: int
+
+
+def get_model_parts_info(
+    model_ast,
+    weights: Mapping[str, int],
+    context: ClassifierContext = DEFAULT_CLASSIFIER_CONTEXT,
+) -> List[ModelPart]:
     parts_info = []
+    model_name = model_ast.name
     for child_node in model_ast.body:
-        node_type = get_model_node_type(child_node)
+        node_type = get_model_node_type(child_node, context)
         if node_type and node_type in weights:
-            parts_info.append({
-                'model_name': model_ast.name,
-                'node': child_node,
-                'type': node_type,
-                'weight': weights[node_type],
-            })
+            parts_info.append(ModelPart(
+                model_name,
+                get_node_name(child_node, node_type),
+                node_type,
+                weights[node_type],
+                child_node.lineno,
+                child_node.col_offset,
+            ))
     return parts_info
 
 
-def get_model_node_type(child_node) -> Optional[str]:
-    direct_node_types_mapping = [
-        (ast.If, lambda n: 'if'),
-        (ast.Pass, lambda n: 'pass'),
-        ((ast.Assign, ast.AnnAssign), lambda n: get_assighment_type(n)),
-        ((ast.FunctionDef, ast.AsyncFunctionDef), lambda n: get_funcdef_type(n)),
-        (ast.Expr, lambda n: 'docstring' if isinstance(n.value, ast.Constant) else 'expression'),
-        (ast.ClassDef, lambda n: 'meta_class' if child_node.name == 'Meta' else 'nested_class'),
-    ]
-    for type_or_type_tuple, type_getter in direct_node_types_mapping:
-        if isinstance(child_node, type_or_type_tuple):  # type: ignore
-            return type_getter(child_node)
+def get_model_node_type(child_node, context: ClassifierContext = DEFAULT_CLASSIFIER_CONTEXT) -> Optional[str]:
+    type_getter = NODE_TYPE_GETTERS.get(type(child_node))
+    return type_getter(child_node, context) if type_getter else None
 
 
-def get_assighment_type(child_node) -> str:
+def get_assighment_type(child_node, context: ClassifierContext = DEFAULT_CLASSIFIER_CONTEXT) -> str:
     assignee_node = child_node.target if isinstance(child_node, ast.AnnAssign) else child_node.targets[0]
     assighment_type = 'field'
     if isinstance(assignee_node, ast.Subscript):
         assighment_type = 'expression'
     if isinstance(assignee_node, ast.Name) and is_caps_lock_str(assignee_node.id):
         assighment_type = 'constant'
-    if isinstance(child_node.value, ast.Call):
-        dump_callable = ast.dump(child_node.value.func)
-        if (
-            'ForeignKey' in dump_callable
-            or 'ManyToManyField' in dump_callable
-            or 'OneToOneField' in dump_callable
-            or 'GenericRelation' in dump_callable
-        ):
-            assighment_type = 'outer_field'
+    if (
+        isinstance(child_node.value, ast.Call)
+        and resolve_callable_name(child_node.value.func, context.imported_names) in context.outer_field_callable_names
+    ):
+        assighment_type = 'outer_field'
     return assighment_type
 
 
-def get_funcdef_type(child_node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> str:
-    special_methods_names = {
-        '__new__',
-        '__init__',
-        '__post_init__',
-        '__str__',
-        'save',
-        'delete',
-    }
-    decorator_names_to_types_map = {
-        'property': 'property_method',
-        'cached_property': 'property_method',
-        'setter': 'property_method',
-        'deleter': 'property_method',
-        'staticmethod': 'static_method',
-        'classmethod': 'class_method',
-
-        'protected_property': 'protected_property_method',
-        'protected_cached_property': 'protected_property_method',
-        'protected_setter': 'protected_property_method',
-        'protected_deleter': 'protected_property_method',
-        'protected_staticmethod': 'protected_static_method',
-        'protected_classmethod': 'protected_class_method',
-
-        'private_property': 'private_property_method',
-        'private_cached_property': 'private_property_method',
-        'private_setter': 'private_property_method',
-        'private_deleter': 'private_property_method',
-        'private_staticmethod': 'private_static_method',
-        'private_classmethod': 'private_class_method',
-    }
-    funcdef = get_funcdef_type_by_decorator_info(child_node, decorator_names_to_types_map)
+def get_funcdef_type(
+    child_node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+    context: ClassifierContext = DEFAULT_CLASSIFIER_CONTEXT,
+) -> str:
+    funcdef = get_funcdef_type_by_decorator_info(child_node, context.decorator_types, context.called_decorator_types)
     if not funcdef:
-        funcdef = get_funcdef_type_by_node_name(child_node, special_methods_names)
+        funcdef = get_funcdef_type_by_node_name(child_node, context.method_name_types)
     return funcdef
 
 
-def get_funcdef_type_by_decorator_info(  # noqa: CFQ004
+def get_funcdef_type_by_decorator_info(
     node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
-    decorator_names_to_types_map: Dict[str, str],
-) -> Union[str, None]:
+    decorator_types: Mapping[str, FuncdefTypes],
+    called_decorator_types: Mapping[str, FuncdefTypes],
+) -> Optional[str]:
     for decorator_info in node.decorator_list:
+        decorator_names_types = decorator_types
+        if isinstance(decorator_info, ast.Call):
+            decorator_info, decorator_names_types = decorator_info.func, called_decorator_types
         if isinstance(decorator_info, ast.Name):
-            decorator_id = decorator_info.id
+            funcdef_types = decorator_names_types.get(decorator_info.id)
         elif isinstance(decorator_info, ast.Attribute):
-            decorator_id = decorator_info.attr
+            funcdef_types = decorator_names_types.get(decorator_info.attr)
         else:
             continue
 
-        if decorator_id in decorator_names_to_types_map:
-            if node.name.startswith('__'):
-                return decorator_names_to_types_map[f'private_{decorator_id}']
-            if node.name.startswith('_'):
-                return decorator_names_to_types_map[f'protected_{decorator_id}']
-            return decorator_names_to_types_map[decorator_id]
+        if funcdef_types:
+            return funcdef_types[get_name_visibility(node.name)]
     return None
 
 
+def get_name_visibility(name: str) -> int:
+    if name.startswith('__'):
+        return 2
+    return 1 if name.startswith('_') else 0
+
+
 def get_funcdef_type_by_node_name(  # noqa: CFQ004
     node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
-    special_methods_names: Set[str],
+    method_name_types: Mapping[str, str],
     default_type: str = 'method',
 ) -> str:
-    if node.name in special_methods_names:
-        return node.name
+    if node.name in method_name_types:
+        return method_name_types[node.name]
     if node.name.startswith('__') and node.name.endswith('__'):
         return 'magic_method'
     if node.name.startswith('__'):
@@ -125,3 +202,58 @@ def get_funcdef_type_by_node_name(  # noqa: CFQ004
 
 def is_caps_lock_str(var_name: str) -> bool:
     return var_name.upper() == var_name
+
+
+NODE_TYPE_GETTERS: Final[Mapping[type, NodeTypeGetter]] = MappingProxyType({
+    ast.If: lambda n, c: 'if',
+    ast.Pass: lambda n, c: 'pass',
+    ast.Assign: get_assighment_type,
+    ast.AnnAssign: get_assighment_type,
+    ast.FunctionDef: get_funcdef_type,
+    ast.AsyncFunctionDef: get_funcdef_type,
+    ast.Expr: lambda n, c: 'docstring' if isinstance(n.value, ast.Constant) else 'expression',
+    ast.ClassDef: lambda n, c: 'meta_class' if n.name == 'Meta' else 'nested_class',
+})
+
+
+def get_name_for_field_node_type(node: Union[ast.Assign, ast.AnnAssign]) -> str:
+    name = '<class_level_assignment>'
+    if isinstance(node, ast.AnnAssign):
+        name = node.target.id if isinstance(node.target, ast.Name) else name
+    elif isinstance(node.targets[0], ast.Name):
+        name = node.targets[0].id
+    elif hasattr(node.targets[0], 'attr'):
+        name = node.targets[0].attr  # type: ignore
+    elif isinstance(node.targets[0], ast.Tuple):
+        name = ', '.join([e.id for e in node.targets[0].elts if isinstance(e, ast.Name)])
+
+    return name
+
+
+NAME_GETTERS_BY_TYPE_POSTFIX: Final[Sequence[Tuple[TypePostfix, NameGetter]]] = (
+    ('docstring', lambda n: 'docstring'),
+    ('meta_class', lambda n: 'Meta'),
+    ('constant', lambda n: n.target.id if isinstance(n, ast.AnnAssign) else n.targets[0].id),  # type: ignore
+    ('field', get_name_for_field_node_type),
+    (('method', *sorted(SPECIAL_METHODS_NAMES)), lambda n: n.name),
+    ('nested_class', lambda n: n.name),
+    ('expression', lambda n: '<class_level_expression>'),
+    ('if', lambda n: 'if ...'),
+)
+
+
+def find_name_getter(node_type: str) -> Optional[NameGetter]:
+    for type_postfix, name_getter in NAME_GETTERS_BY_TYPE_POSTFIX:
+        if node_type.endswith(type_postfix):
+            return name_getter
+    return None
+
+
+NODE_NAME_GETTERS: Final[Mapping[str, Optional[NameGetter]]] = MappingProxyType({
+    node_type: find_name_getter(node_type) for node_type in STRICT_NODE_TYPE_WEIGHTS
+})
+
+
+def get_node_name(node, node_type: str) -> Optional[str]:
+    name_getter = NODE_NAME_GETTERS.get(node_type) or find_name_getter(node_type)
+    return name_getter(node) if name_getter else None
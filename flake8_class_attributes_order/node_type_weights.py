@@ -152,5 +152,5 @@ def get_node_weights(options=None) -> Mapping[str, int]:
         result = NON_STRICT_NODE_TYPE_WEIGHTS
 
     if ignore_docstring:
-        result.pop('docstring')
+        result = {node_type: weight for node_type, weight in result.items() if node_type != 'docstring'}
     return result
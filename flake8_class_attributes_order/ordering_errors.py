@@ -1,69 +1,99 @@
-import ast
-from typing import Tuple, List, Union
+from bisect import bisect_right
+from itertools import islice, zip_longest
+from typing import Iterator, NamedTuple, Tuple, List, Optional, Sequence
 
+from flake8_class_attributes_order.model_parts_info import ModelPart
 
-def get_ordering_errors(model_parts_info) -> List[Tuple[int, int, str]]:
-    errors = []
-    for model_part, next_model_part in zip(model_parts_info, model_parts_info[1:] + [None]):
+
+class OrderingError(NamedTuple):
+    code: str
+    lineno: int
+    col_offset: int
+    model_parts_info: Sequence[ModelPart]
+    part_index: int
+    anchor_index: Optional[int]
+
+
+def get_ordering_errors(model_parts_info: Sequence[ModelPart]) -> List[Tuple[int, int, str]]:
+    return [format_ordering_error(error) for error in iter_ordering_errors(model_parts_info)]
+
+
+def iter_ordering_errors(model_parts_info: Sequence[ModelPart]) -> Iterator[OrderingError]:
+    part_pairs = zip_longest(model_parts_info, islice(model_parts_info, 1, None))
+    for part_index, (model_part, next_model_part) in enumerate(part_pairs):
         if (
             next_model_part
-            and model_part['model_name'] == next_model_part['model_name']
-            and model_part['weight'] > next_model_part['weight']
+            and model_part.model_name == next_model_part.model_name
+            and model_part.weight > next_model_part.weight
         ):
-            errors.append((
-                model_part['node'].lineno,
-                model_part['node'].col_offset,
-                'CCE001 {0}.{1} should be after {0}.{2}'.format(
-                    model_part['model_name'],
-                    get_node_name(model_part['node'], model_part['type']),
-                    get_node_name(next_model_part['node'], next_model_part['type']),
-                ),
-            ))
-        if model_part['type'] in ['expression', 'if']:
-            errors.append((
-                model_part['node'].lineno,
-                model_part['node'].col_offset,
-                'CCE002 Class level expression detected in class {0}, line {1}'.format(
-                    model_part['model_name'],
-                    model_part['node'].lineno,
-                ),
-            ))
-    return errors
+            yield OrderingError(
+                'CCE001', model_part.lineno, model_part.col_offset, model_parts_info, part_index, None,
+            )
+        if model_part.node_type in ('expression', 'if'):
+            yield OrderingError(
+                'CCE002', model_part.lineno, model_part.col_offset, model_parts_info, part_index, None,
+            )
 
 
-def get_node_name(node, node_type: str):
-    special_methods_names = (
-        '__new__',
-        '__init__',
-        '__post_init__',
-        '__str__',
-        'save',
-        'delete',
-    )
-    name_getters_by_type = [
-        ('docstring', lambda n: 'docstring'),
-        ('meta_class', lambda n: 'Meta'),
-        ('constant', lambda n: n.target.id if isinstance(n, ast.AnnAssign) else n.targets[0].id),  # type: ignore
-        ('field', get_name_for_field_node_type),
-        (('method',) + special_methods_names, lambda n: n.name),
-        ('nested_class', lambda n: n.name),
-        ('expression', lambda n: '<class_level_expression>'),
-        ('if', lambda n: 'if ...'),
-    ]
-    for type_postfix, name_getter in name_getters_by_type:
-        if node_type.endswith(type_postfix):  # type: ignore
-            return name_getter(node)
+def iter_minimal_move_errors(model_parts_info: Sequence[ModelPart]) -> Iterator[OrderingError]:
+    kept_indexes = get_longest_non_decreasing_subsequence([model_part.weight for model_part in model_parts_info])
+    kept_weights = [model_parts_info[part_index].weight for part_index in kept_indexes]
+    kept_indexes_set = frozenset(kept_indexes)
+    for part_index, model_part in enumerate(model_parts_info):
+        if part_index not in kept_indexes_set:
+            anchor_position = max(bisect_right(kept_weights, model_part.weight) - 1, 0)
+            yield OrderingError(
+                'CCE001',
+                model_part.lineno,
+                model_part.col_offset,
+                model_parts_info,
+                part_index,
+                kept_indexes[anchor_position],
+            )
+        if model_part.node_type in ('expression', 'if'):
+            yield OrderingError(
+                'CCE002', model_part.lineno, model_part.col_offset, model_parts_info, part_index, None,
+            )
+
+
+def get_longest_non_decreasing_subsequence(weights: Sequence[int]) -> List[int]:
+    tail_weights: List[int] = []
+    tail_indexes: List[int] = []
+    previous_indexes: List[Optional[int]] = []
+    for index, weight in enumerate(weights):
+        position = bisect_right(tail_weights, weight)
+        previous_indexes.append(tail_indexes[position - 1] if position else None)
+        if position == len(tail_weights):
+            tail_weights.append(weight)
+            tail_indexes.append(index)
+        else:
+            tail_weights[position] = weight
+            tail_indexes[position] = index
+    subsequence = []
+    current_index = tail_indexes[-1] if tail_indexes else None
+    while current_index is not None:
+        subsequence.append(current_index)
+        current_index = previous_indexes[current_index]
+    return subsequence[::-1]
 
 
-def get_name_for_field_node_type(node: Union[ast.Assign, ast.AnnAssign]) -> str:
-    name = '<class_level_assignment>'
-    if isinstance(node, ast.AnnAssign):
-        name = node.target.id if isinstance(node.target, ast.Name) else name
-    elif isinstance(node.targets[0], ast.Name):
-        name = node.targets[0].id
-    elif hasattr(node.targets[0], 'attr'):
-        name = node.targets[0].attr  # type: ignore
-    elif isinstance(node.targets[0], ast.Tuple):
-        name = ', '.join([e.id for e in node.targets[0].elts if isinstance(e, ast.Name)])
+def format_ordering_error(error: OrderingError) -> Tuple[int, int, str]:
+    return error.lineno, error.col_offset, get_error_message(error)
 
-    return name
+
+def get_error_message(error: OrderingError) -> str:
+    model_part = error.model_parts_info[error.part_index]
+    if error.code == 'CCE002':
+        return f'CCE002 Class level expression detected in class {model_part.model_name}, line {error.lineno}'
+    if error.anchor_index is None:
+        message_template = 'CCE001 {0}.{1} should be after {0}.{2}'
+        anchor_part = error.model_parts_info[error.part_index + 1]
+    else:
+        anchor_part = error.model_parts_info[error.anchor_index]
+        relation = 'after' if anchor_part.weight <= model_part.weight else 'before'
+        message_template = f'CCE001 {{0}}.{{1}} should be moved {relation} {{0}}.{{2}}'
+    return message_template.format(
+        model_part.model_name,
+        model_part.name,
+        anchor_part.name,
+    )
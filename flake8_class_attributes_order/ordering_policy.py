@@ -0,0 +1,269 @@
+import copy
+import hashlib
+import logging
+import os
+import re
+import warnings
+from types import MappingProxyType, SimpleNamespace
+from typing import AbstractSet, Any, Dict, Iterable, Mapping, NamedTuple, Optional, Pattern, Sequence, Tuple
+
+from flake8.style_guide import Decision, DecisionEngine
+from flake8.utils import matches_filename, normalize_path, parse_files_to_codes_mapping
+from typing_extensions import Final
+
+from flake8_class_attributes_order.baseline import Baseline, get_baseline_path, load_baseline
+from flake8_class_attributes_order.model_parts_info import (
+    DEFAULT_DECORATOR_TYPES, DEFAULT_METHOD_NAME_TYPES, OUTER_FIELD_CALLABLE_NAMES, ClassifierContext, FuncdefTypes,
+    compile_decorator_types,
+)
+from flake8_class_attributes_order.node_type_weights import CONFIGURABLE_NODE_TYPES, get_node_weights
+
+
+PerFileDisabledCodes = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+logger = logging.getLogger(__name__)
+
+ERROR_CODES: Final = ('CCE001', 'CCE002')
+
+# classification rules are applied to methods only
+METHOD_NODE_TYPES: Final = tuple(
+    node_type for node_type, node_type_path in CONFIGURABLE_NODE_TYPES.items() if node_type_path[-1] == 'method'
+)
+
+REPORT_MODES: Final = ('adjacent', 'minimal-moves')
+DEFAULT_REPORT_MODE: Final = 'adjacent'
+
+DECISION_ENGINE_OPTIONS: Final = (
+    'select',
+    'extend_select',
+    'extended_default_select',
+    'ignore',
+    'extend_ignore',
+    'extended_default_ignore',
+)
+
+POLICY_OPTIONS_DEFAULTS: Final[Mapping[str, Any]] = MappingProxyType({
+    'use_class_attributes_order_strict_mode': False,
+    'class_attributes_order': None,
+    'ignore_docstring': False,
+    'class_attributes_order_outer_fields': None,
+    'class_attributes_order_max_errors_per_class': None,
+    'class_attributes_order_max_errors_per_file': None,
+    'class_attributes_order_fail_fast': False,
+    'class_attributes_order_report_mode': DEFAULT_REPORT_MODE,
+    'class_attributes_order_generated_markers': None,
+    'class_attributes_order_exclude_classes': None,
+    'class_attributes_order_exclude_bases': None,
+    'class_attributes_order_skip_function_scopes': False,
+    'class_attributes_order_baseline': None,
+    'class_attributes_order_decorator_types': None,
+    'class_attributes_order_method_types': None,
+    'disable_noqa': False,
+})
+
+
+class OptionsFingerprint(NamedTuple):
+    use_strict_mode: bool
+    class_attributes_order: Optional[Tuple[str, ...]]
+    ignore_docstring: bool
+    outer_field_callable_names: Tuple[str, ...]
+    max_errors_per_class: int
+    max_errors_per_file: int
+    fail_fast: bool
+    disabled_codes: Tuple[str, ...]
+    per_file_disabled_codes: PerFileDisabledCodes
+    report_mode: str
+    generated_markers: Tuple[str, ...]
+    excluded_class_patterns: Tuple[str, ...]
+    excluded_base_names: Tuple[str, ...]
+    skip_function_scopes: bool
+    baseline_path: Optional[str]
+    decorator_type_rules: Tuple[str, ...]
+    method_type_rules: Tuple[str, ...]
+    disable_noqa: bool
+
+
+class OrderingPolicy(NamedTuple):
+    fingerprint: OptionsFingerprint
+    digest: str
+    weights: Mapping[str, int]
+    outer_field_callable_names: AbstractSet[str]
+    max_errors_per_class: int
+    max_errors_per_file: int
+    fail_fast: bool
+    disabled_codes: AbstractSet[str]
+    per_file_disabled_codes: Tuple[Tuple[str, AbstractSet[str]], ...]
+    report_mode: str
+    generated_markers: Tuple[str, ...]
+    excluded_class_name_re: Optional[Pattern[str]]
+    excluded_base_names: AbstractSet[str]
+    skip_function_scopes: bool
+    baseline: Optional[Baseline]
+    decorator_types: Mapping[str, FuncdefTypes]
+    called_decorator_types: Mapping[str, FuncdefTypes]
+    method_name_types: Mapping[str, str]
+    disable_noqa: bool
+
+
+_compiled_policies: Dict[OptionsFingerprint, OrderingPolicy] = {}
+
+
+def get_ordering_policy(options) -> OrderingPolicy:
+    fingerprint = get_options_fingerprint(options)
+    policy = _compiled_policies.get(fingerprint)
+    if policy is None:
+        policy = compile_ordering_policy(options, fingerprint)
+        _compiled_policies[fingerprint] = policy
+    return policy
+
+
+def build_ordering_policy(**options: Any) -> OrderingPolicy:
+    unknown_options = options.keys() - POLICY_OPTIONS_DEFAULTS.keys()
+    if unknown_options:
+        raise TypeError(f'Unknown ordering options: {", ".join(sorted(unknown_options))}')
+    report_mode = options.get('class_attributes_order_report_mode', DEFAULT_REPORT_MODE)
+    if report_mode not in REPORT_MODES:
+        raise ValueError(f'Unknown report mode: {report_mode}')
+    return get_ordering_policy(SimpleNamespace(**{**POLICY_OPTIONS_DEFAULTS, **options}))
+
+
+def compile_ordering_policy(options, fingerprint: OptionsFingerprint) -> OrderingPolicy:
+    baseline = load_baseline(fingerprint.baseline_path) if fingerprint.baseline_path else None
+    configured_decorator_types = compile_decorator_types(parse_type_rules(fingerprint.decorator_type_rules))
+    return OrderingPolicy(
+        fingerprint=fingerprint,
+        digest=hashlib.sha256(f'{tuple(fingerprint)!r}{baseline.digest if baseline else ""}'.encode()).hexdigest(),
+        weights=MappingProxyType(dict(get_node_weights(options))),
+        outer_field_callable_names=frozenset(fingerprint.outer_field_callable_names),
+        max_errors_per_class=fingerprint.max_errors_per_class,
+        max_errors_per_file=fingerprint.max_errors_per_file,
+        fail_fast=fingerprint.fail_fast,
+        disabled_codes=frozenset(fingerprint.disabled_codes),
+        per_file_disabled_codes=tuple(
+            (filename_pattern, frozenset(disabled_codes))
+            for filename_pattern, disabled_codes in fingerprint.per_file_disabled_codes
+        ),
+        report_mode=fingerprint.report_mode,
+        generated_markers=fingerprint.generated_markers,
+        excluded_class_name_re=compile_class_name_patterns(fingerprint.excluded_class_patterns),
+        excluded_base_names=frozenset(fingerprint.excluded_base_names),
+        skip_function_scopes=fingerprint.skip_function_scopes,
+        baseline=baseline,
+        decorator_types=MappingProxyType({**DEFAULT_DECORATOR_TYPES, **configured_decorator_types}),
+        # only configured rules match called decorators, default ones are matched by bare name as before
+        called_decorator_types=configured_decorator_types,
+        method_name_types=MappingProxyType({
+            **DEFAULT_METHOD_NAME_TYPES,
+            **parse_type_rules(fingerprint.method_type_rules),
+        }),
+        disable_noqa=fingerprint.disable_noqa,
+    )
+
+
+def get_options_fingerprint(options) -> OptionsFingerprint:
+    class_attributes_order = options.class_attributes_order
+    outer_fields = getattr(options, 'class_attributes_order_outer_fields', None) or OUTER_FIELD_CALLABLE_NAMES
+    return OptionsFingerprint(
+        use_strict_mode=bool(options.use_class_attributes_order_strict_mode),
+        class_attributes_order=tuple(class_attributes_order) if class_attributes_order else None,
+        ignore_docstring=bool(getattr(options, 'ignore_docstring', False)),
+        outer_field_callable_names=tuple(sorted(set(outer_fields))),
+        max_errors_per_class=getattr(options, 'class_attributes_order_max_errors_per_class', None) or 0,
+        max_errors_per_file=getattr(options, 'class_attributes_order_max_errors_per_file', None) or 0,
+        fail_fast=bool(getattr(options, 'class_attributes_order_fail_fast', False)),
+        disabled_codes=get_disabled_codes(options),
+        per_file_disabled_codes=get_per_file_disabled_codes(options),
+        report_mode=getattr(options, 'class_attributes_order_report_mode', None) or DEFAULT_REPORT_MODE,
+        generated_markers=get_sorted_option_values(options, 'class_attributes_order_generated_markers'),
+        excluded_class_patterns=get_sorted_option_values(options, 'class_attributes_order_exclude_classes'),
+        excluded_base_names=get_sorted_option_values(options, 'class_attributes_order_exclude_bases'),
+        skip_function_scopes=bool(getattr(options, 'class_attributes_order_skip_function_scopes', False)),
+        baseline_path=get_absolute_path(getattr(options, 'class_attributes_order_baseline', None)),
+        decorator_type_rules=get_sorted_option_values(options, 'class_attributes_order_decorator_types'),
+        method_type_rules=get_sorted_option_values(options, 'class_attributes_order_method_types'),
+        disable_noqa=bool(getattr(options, 'disable_noqa', False)),
+    )
+
+
+def get_absolute_path(path: Optional[str]) -> Optional[str]:
+    return os.path.abspath(path) if path else None
+
+
+def get_sorted_option_values(options, option_name: str) -> Tuple[str, ...]:
+    return tuple(sorted(set(getattr(options, option_name, None) or ())))
+
+
+def parse_type_rules(rules: Iterable[str]) -> Dict[str, str]:
+    type_rules = {}
+    for rule in rules:
+        name, _, node_type = (rule_part.strip() for rule_part in rule.partition(':'))
+        if not name or node_type not in METHOD_NODE_TYPES:
+            warnings.warn(  # noqa: B028
+                f'Classification rule {rule!r} is ignored: expected name:node_type with one of '
+                f'{", ".join(METHOD_NODE_TYPES)} node types',
+                Warning,
+            )
+            continue
+        type_rules[name] = node_type
+    return type_rules
+
+
+def compile_class_name_patterns(patterns: Sequence[str]) -> Optional[Pattern[str]]:
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns)) if patterns else None
+
+
+def get_disabled_codes(options) -> Tuple[str, ...]:
+    if not has_decision_engine_options(options):
+        return ()
+    decision_engine = DecisionEngine(options)
+    return tuple(code for code in ERROR_CODES if decision_engine.decision_for(code) is Decision.Ignored)
+
+
+def get_per_file_disabled_codes(options) -> PerFileDisabledCodes:
+    per_file_ignores = getattr(options, 'per_file_ignores', None)
+    if not per_file_ignores or not has_decision_engine_options(options):
+        return ()
+    per_file_disabled_codes = []
+    for filename_pattern, ignored_codes in parse_files_to_codes_mapping(per_file_ignores):
+        file_options = copy.copy(options)
+        file_options.extend_ignore = [*(options.extend_ignore or ()), *ignored_codes]
+        per_file_disabled_codes.append((normalize_path(filename_pattern), get_disabled_codes(file_options)))
+    # flake8 applies the style guide with the longest matching filename pattern
+    return tuple(sorted(per_file_disabled_codes, key=lambda pattern_codes: -len(pattern_codes[0])))
+
+
+def has_decision_engine_options(options) -> bool:
+    return all(hasattr(options, option_name) for option_name in DECISION_ENGINE_OPTIONS)
+
+
+def get_file_disabled_codes(policy: OrderingPolicy, filename: Optional[str]) -> AbstractSet[str]:
+    if filename:
+        for filename_pattern, disabled_codes in policy.per_file_disabled_codes:
+            if matches_filename(filename, [filename_pattern], 'Are CCE codes ignored in %(path)s? %(whether)s', logger):
+                return disabled_codes
+    return policy.disabled_codes
+
+
+def are_all_codes_disabled(policy: OrderingPolicy, filename: Optional[str]) -> bool:
+    disabled_codes = get_file_disabled_codes(policy, filename)
+    return all(code in disabled_codes for code in ERROR_CODES)
+
+
+def get_file_results_digest(policy: OrderingPolicy, filename: str) -> str:
+    # per-file ignores and baseline suppression depend on the file path, not only on its content
+    digest = policy.digest
+    if policy.per_file_disabled_codes:
+        digest = f'{digest}\0{",".join(sorted(get_file_disabled_codes(policy, filename)))}'
+    if policy.baseline is not None:
+        digest = f'{digest}\0{get_baseline_path(filename, policy.baseline.directory)}'
+    return digest
+
+
+def get_classifier_context(policy: OrderingPolicy, imported_names: Mapping[str, str]) -> ClassifierContext:
+    return ClassifierContext(
+        imported_names,
+        policy.outer_field_callable_names,
+        policy.decorator_types,
+        policy.called_decorator_types,
+        policy.method_name_types,
+    )
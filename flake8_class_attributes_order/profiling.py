@@ -0,0 +1,116 @@
+import json
+import multiprocessing
+import os
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+from multiprocessing.util import Finalize
+from typing import Dict, Iterator, Optional, Tuple, TypeVar
+
+from typing_extensions import ContextManager, DefaultDict
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+
+PROFILE_ENV_VARIABLE = 'FLAKE8_CLASS_ATTRIBUTES_ORDER_PROFILE'
+
+NULL_PHASE: ContextManager[None] = nullcontext()
+EXHAUSTED = object()
+
+IteratedItem = TypeVar('IteratedItem')
+
+
+class Profiler:
+
+    def __init__(self, output_path: str):
+        self.output_path = output_path
+        self.phase_seconds: DefaultDict[str, float] = defaultdict(float)
+        self.phase_calls: Counter = Counter()
+        self.counters: Counter = Counter()
+
+    @contextmanager
+    def phase(self, phase_name: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_seconds[phase_name] += time.perf_counter() - started_at
+            self.phase_calls[phase_name] += 1
+
+    def timed_iter(self, phase_name: str, iterator: Iterator[IteratedItem]) -> Iterator[IteratedItem]:
+        while True:
+            with self.phase(phase_name):
+                item = next(iterator, EXHAUSTED)
+            if item is EXHAUSTED:
+                return
+            yield item  # type: ignore
+
+    def count(self, counter_name: str, increment: int = 1) -> None:
+        self.counters[counter_name] += increment
+
+    def flush(self) -> None:
+        if not (self.phase_calls or self.counters):
+            return
+        with open(self.output_path, 'a+') as profile_file:
+            if fcntl is not None:
+                fcntl.flock(profile_file, fcntl.LOCK_EX)
+            profile_file.seek(0)
+            summary = merge_profile_summary(json.loads(profile_file.read() or '{}'), self)
+            profile_file.seek(0)
+            profile_file.truncate()
+            json.dump(summary, profile_file, indent=2, sort_keys=True)
+        self.reset()
+
+    def reset(self) -> None:
+        self.phase_seconds.clear()
+        self.phase_calls.clear()
+        self.counters.clear()
+
+
+_process_profilers: Dict[Tuple[int, str], Profiler] = {}
+
+
+def get_profile_path(options) -> Optional[str]:
+    return getattr(options, 'class_attributes_order_profile', None) or os.environ.get(PROFILE_ENV_VARIABLE)
+
+
+def get_profiler(output_path: Optional[str]) -> Optional[Profiler]:
+    if not output_path:
+        return None
+    profiler_key = (os.getpid(), output_path)
+    if profiler_key not in _process_profilers:
+        profiler = Profiler(output_path)
+        Finalize(profiler, profiler.flush, exitpriority=10)
+        _process_profilers[profiler_key] = profiler
+    return _process_profilers[profiler_key]
+
+
+def reset_profile(output_path: Optional[str]) -> None:
+    # a run starts from an empty summary in the main process, worker processes merge into it
+    if not output_path or multiprocessing.parent_process() is not None:
+        return
+    with open(output_path, 'w'):
+        pass
+    profiler = _process_profilers.get((os.getpid(), output_path))
+    if profiler is not None:
+        profiler.reset()
+
+
+def get_phase(profiler: Optional[Profiler], phase_name: str) -> ContextManager[None]:
+    return NULL_PHASE if profiler is None else profiler.phase(phase_name)
+
+
+def merge_profile_summary(summary: Dict, profiler: Profiler) -> Dict:
+    phases = summary.setdefault('phases', {})
+    for phase_name, phase_calls in profiler.phase_calls.items():
+        phase_summary = phases.setdefault(phase_name, {'seconds': 0.0, 'calls': 0})
+        phase_summary['seconds'] += profiler.phase_seconds[phase_name]
+        phase_summary['calls'] += phase_calls
+    counters = summary.setdefault('counters', {})
+    for counter_name, counter_value in profiler.counters.items():
+        counters[counter_name] = counters.get(counter_name, 0) + counter_value
+    summary['processes'] = summary.get('processes', 0) + 1
+    return summary
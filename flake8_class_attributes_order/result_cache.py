@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from flake8_class_attributes_order import __version__ as version
+
+
+DEFAULT_CACHE_SIZE_MB = 256
+EVICTION_CHECK_INTERVAL = 100
+
+CachedErrors = List[Tuple[int, int, str]]
+
+
+class ResultCache:
+
+    def __init__(self, cache_dir: str, max_size: int):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.max_size = max_size
+        self.writes_since_eviction = 0
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            os.path.join(cache_dir, 'results.sqlite3'),
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS results '
+            '(key TEXT PRIMARY KEY, errors TEXT NOT NULL, size INTEGER NOT NULL, accessed_at REAL NOT NULL)',
+        )
+        self.connection.execute('CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at)')
+
+    def load(self, key: str) -> Optional[CachedErrors]:
+        try:
+            with self.lock:
+                row = self.connection.execute('SELECT errors FROM results WHERE key = ?', (key,)).fetchone()
+                if row is None:
+                    return None
+                self.connection.execute('UPDATE results SET accessed_at = ? WHERE key = ?', (time.time(), key))
+        except sqlite3.Error:
+            return None
+        return [(lineno, col_offset, message) for lineno, col_offset, message in json.loads(row[0])]
+
+    def store(self, key: str, errors: CachedErrors) -> None:
+        serialized_errors = json.dumps(errors)
+        try:
+            with self.lock:
+                self.connection.execute(
+                    'INSERT OR REPLACE INTO results (key, errors, size, accessed_at) VALUES (?, ?, ?, ?)',
+                    (key, serialized_errors, len(key) + len(serialized_errors), time.time()),
+                )
+                self.writes_since_eviction += 1
+            if self.writes_since_eviction >= EVICTION_CHECK_INTERVAL:
+                self.evict()
+        except sqlite3.Error:
+            return
+
+    def evict(self) -> None:
+        with self.lock:
+            self.writes_since_eviction = 0
+            self.connection.execute(
+                'DELETE FROM results WHERE key IN ('
+                '  SELECT key FROM ('
+                '    SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS total_size FROM results'
+                '  ) WHERE total_size > ?'
+                ')',
+                (self.max_size,),
+            )
+
+
+_open_caches: Dict[Tuple[int, str], ResultCache] = {}
+
+
+def get_result_cache(options) -> Optional[ResultCache]:
+    cache_dir = getattr(options, 'class_attributes_order_cache_dir', None)
+    if not cache_dir:
+        return None
+    cache_key = (os.getpid(), cache_dir)
+    if cache_key not in _open_caches:
+        cache_size_mb = getattr(options, 'class_attributes_order_cache_size', None) or DEFAULT_CACHE_SIZE_MB
+        _open_caches[cache_key] = ResultCache(cache_dir, cache_size_mb * 1024 * 1024)
+    return _open_caches[cache_key]
+
+
+def get_cache_key(content: bytes, policy_digest: str) -> str:
+    content_hash = hashlib.sha256(content)
+    content_hash.update(f'\0{version}\0{sys.hexversion}\0{policy_digest}'.encode())
+    return content_hash.hexdigest()
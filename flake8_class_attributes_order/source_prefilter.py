@@ -0,0 +1,22 @@
+import mmap
+import re
+from typing import Optional, Tuple
+
+from typing_extensions import Final
+
+
+CLASS_STATEMENT_RE: Final = re.compile(rb'(?:^|[\r;:]|\xef\xbb\xbf)[ \t\f]*class\b', re.MULTILINE)
+
+
+def may_contain_class(source: bytes) -> bool:
+    return CLASS_STATEMENT_RE.search(source) is not None
+
+
+def read_source_with_classes(file_handler) -> Tuple[Optional[bytes], int]:
+    file_size = file_handler.seek(0, 2)
+    if not file_size:
+        return None, file_size
+    with mmap.mmap(file_handler.fileno(), 0, access=mmap.ACCESS_READ) as mapped_source:
+        if CLASS_STATEMENT_RE.search(mapped_source) is None:
+            return None, file_size
+        return mapped_source[:], file_size
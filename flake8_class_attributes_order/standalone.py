@@ -0,0 +1,492 @@
+import argparse
+import ast
+import io
+import logging
+import os
+import subprocess
+import sys
+import tokenize
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+from flake8.defaults import EXCLUDE, NOQA_FILE
+from flake8.options.aggregator import aggregate_options
+from flake8.options.config import load_config
+from flake8.options.manager import OptionManager
+from flake8.utils import matches_filename
+
+from flake8_class_attributes_order import __version__ as version
+from flake8_class_attributes_order.api import get_source_errors
+from flake8_class_attributes_order.autofix import fix_source
+from flake8_class_attributes_order.baseline import BaselineEntry, write_baseline
+from flake8_class_attributes_order.checker import ClassAttributesOrderChecker
+from flake8_class_attributes_order.diff_scope import LineRange, get_git_diff, normalize_path, parse_unified_diff
+from flake8_class_attributes_order.exclusions import is_generated_header, is_inline_ignored
+from flake8_class_attributes_order.ordering_policy import get_file_results_digest, get_ordering_policy
+from flake8_class_attributes_order.profiling import get_profile_path, reset_profile
+from flake8_class_attributes_order.result_cache import get_cache_key, get_result_cache
+from flake8_class_attributes_order.source_prefilter import read_source_with_classes
+from flake8_class_attributes_order.violation_stats import (
+    VIOLATION_STATS_FORMATTERS, ViolationStats, create_violation_stats, merge_violation_counts,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class FileReport(NamedTuple):
+    filename: str
+    errors: List[Tuple[int, int, str]]
+    stats: Counter
+    baseline_entries: List[BaselineEntry]
+    violation_counts: Counter
+
+
+FileWorker = Callable[[str, Optional[Sequence[LineRange]]], FileReport]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    options = parse_args(sys.argv[1:] if argv is None else argv)
+    reset_profile(get_profile_path(options))
+    if options.serve:
+        return run_daemon(options)
+    exclude = [*options.exclude, *options.extend_exclude]
+    filenames = list(iter_python_files(options.filenames or ['.'], exclude))
+    try:
+        changed_line_ranges = get_changed_line_ranges(options)
+    except (subprocess.CalledProcessError, OSError) as error:
+        sys.stderr.write(get_diff_error_message(error))
+        return 2
+    if changed_line_ranges is not None:
+        filenames = [filename for filename in filenames if normalize_path(filename) in changed_line_ranges]
+    if options.write_baseline or options.stats_only:
+        options = get_unlimited_options(options)
+    errors_count = 0
+    run_stats: Counter = Counter()
+    baseline_entries: List[BaselineEntry] = []
+    violation_stats = create_violation_stats()
+    worker = get_file_worker(options)
+    for report in check_files(filenames, options, changed_line_ranges, worker):
+        for lineno, col_offset, message in report.errors:
+            sys.stdout.write(f'{report.filename}:{lineno}:{col_offset + 1}: {message}\n')
+        errors_count += len(report.errors)
+        run_stats.update(report.stats)
+        baseline_entries.extend(report.baseline_entries)
+        merge_violation_counts(violation_stats, normalize_path(report.filename), report.violation_counts)
+    write_run_outputs(options, run_stats, baseline_entries, violation_stats)
+    return 1 if errors_count else 0
+
+
+def run_daemon(options: argparse.Namespace) -> int:
+    from flake8_class_attributes_order.daemon import serve  # noqa: I251
+    try:
+        serve(options.serve, options, options.idle_timeout)
+    except FileExistsError as error:
+        sys.stderr.write(f'{error}\n')
+        return 2
+    return 0
+
+
+def write_run_outputs(
+    options: argparse.Namespace,
+    run_stats: Counter,
+    baseline_entries: List[BaselineEntry],
+    violation_stats: ViolationStats,
+) -> None:
+    if options.write_baseline:
+        write_baseline(options.write_baseline, baseline_entries)
+    if options.stats_only:
+        sys.stdout.write(VIOLATION_STATS_FORMATTERS[options.stats_format](violation_stats))
+    if options.show_run_stats:
+        write_run_stats(run_stats)
+
+
+def get_unlimited_options(options: argparse.Namespace) -> argparse.Namespace:
+    # baseline and statistics cover every error, regardless of error limits
+    return argparse.Namespace(**{
+        **vars(options),
+        'class_attributes_order_baseline': None if options.write_baseline else options.class_attributes_order_baseline,
+        'class_attributes_order_max_errors_per_class': None,
+        'class_attributes_order_max_errors_per_file': None,
+        'class_attributes_order_fail_fast': False,
+    })
+
+
+def get_file_worker(options: argparse.Namespace) -> FileWorker:
+    if options.write_baseline:
+        return baseline_file
+    if options.stats_only:
+        return count_file
+    return fix_file if options.fix else check_file
+
+
+def get_changed_line_ranges(options: argparse.Namespace) -> Optional[Dict[str, List[LineRange]]]:
+    if options.diff_revision:
+        diff_text = get_git_diff(options.diff_revision)
+    elif options.diff == '-':
+        diff_text = sys.stdin.read()
+    elif options.diff:
+        with open(options.diff) as diff_file:
+            diff_text = diff_file.read()
+    else:
+        return None
+    return parse_unified_diff(diff_text)
+
+
+def get_diff_error_message(error: Union[subprocess.CalledProcessError, OSError]) -> str:
+    # git prints its usage after some errors, the first line is enough
+    if isinstance(error, subprocess.CalledProcessError) and error.stderr.strip():
+        return f'{error.stderr.strip().splitlines()[0]}\n'
+    return f'{error}\n'
+
+
+def write_run_stats(run_stats: Counter) -> None:
+    for stat_name, stat_value in sorted(run_stats.items()):
+        sys.stderr.write(f'{stat_name}: {stat_value}\n')
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    standalone_parser = get_standalone_parser()
+    preliminary_options, _ = standalone_parser.parse_known_args(argv)
+    option_manager = OptionManager(
+        version=version,
+        plugin_versions=f'{ClassAttributesOrderChecker.name}: {version}',
+        parents=[standalone_parser],
+        formatter_names=[],
+    )
+    option_manager.parser.prog = 'python -m flake8_class_attributes_order'
+    register_standalone_options(option_manager)
+    # flake8 selects the codes of the plugin entry point by default
+    option_manager.extend_default_select(['CCE'])
+    ClassAttributesOrderChecker.add_options(option_manager)
+    cfg, cfg_dir = load_config(preliminary_options.config, [], isolated=preliminary_options.isolated)
+    return aggregate_options(option_manager, cfg, cfg_dir, argv)
+
+
+def get_standalone_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of worker processes to check files in parallel',
+    )
+    parser.add_argument('--config', help='Path to the config file to read options from')
+    parser.add_argument('--isolated', action='store_true', help='Ignore all configuration files')
+    parser.add_argument(
+        '--show-run-stats',
+        action='store_true',
+        help='Print counters of checked and skipped files to stderr',
+    )
+    parser.add_argument(
+        '--fix',
+        action='store_true',
+        help='Reorder class members in place and report errors that are left',
+    )
+    parser.add_argument(
+        '--write-baseline',
+        metavar='BASELINE_PATH',
+        help='Write all current errors to a baseline file instead of reporting them',
+    )
+    parser.add_argument(
+        '--stats-only',
+        action='store_true',
+        help='Print violation counts per code, directory and class instead of errors',
+    )
+    parser.add_argument(
+        '--stats-format',
+        choices=tuple(VIOLATION_STATS_FORMATTERS),
+        default='json',
+        help='Format of --stats-only output (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--serve',
+        metavar='SOCKET_PATH',
+        help='Run a checker daemon accepting JSON check requests on a Unix socket',
+    )
+    parser.add_argument(
+        '--idle-timeout',
+        type=float,
+        default=600,
+        help='Seconds without requests after which the daemon exits (default: %(default)s)',
+    )
+    diff_group = parser.add_mutually_exclusive_group()
+    diff_group.add_argument(
+        '--diff',
+        metavar='DIFF_FILE',
+        help='Check only classes touched by hunks of a unified diff file (- to read from stdin)',
+    )
+    diff_group.add_argument(
+        '--diff-revision',
+        metavar='REVISION_RANGE',
+        help='Check only classes touched by `git diff REVISION_RANGE`',
+    )
+    return parser
+
+
+def register_standalone_options(option_manager: OptionManager) -> None:
+    option_manager.add_option(
+        '--exclude',
+        default=','.join(EXCLUDE),
+        comma_separated_list=True,
+        parse_from_config=True,
+        normalize_paths=True,
+        help='Comma-separated list of files or directories to exclude',
+    )
+    option_manager.add_option(
+        '--extend-exclude',
+        default='',
+        comma_separated_list=True,
+        parse_from_config=True,
+        normalize_paths=True,
+        help='Comma-separated list of files or directories to add to the list of excluded ones',
+    )
+    for option_name, option_help in (
+        ('--select', 'Comma-separated list of error codes to report'),
+        ('--extend-select', 'Comma-separated list of error codes to add to the selected ones'),
+        ('--ignore', 'Comma-separated list of error codes to ignore'),
+        ('--extend-ignore', 'Comma-separated list of error codes to add to the ignored ones'),
+    ):
+        option_manager.add_option(
+            option_name, metavar='errors', comma_separated_list=True, parse_from_config=True, help=option_help,
+        )
+    option_manager.add_option(
+        '--disable-noqa',
+        default=False,
+        action='store_true',
+        parse_from_config=True,
+        help='Report errors on lines with "# noqa" comments',
+    )
+    option_manager.add_option(
+        '--per-file-ignores',
+        default='',
+        parse_from_config=True,
+        help='Pairs of filename patterns and error codes to ignore in matching files',
+    )
+
+
+def iter_python_files(paths: Iterable[str], exclude: Sequence[str]) -> Iterator[str]:
+    for path in paths:
+        if is_excluded(path, exclude):
+            continue
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames[:] = sorted(
+                dirname for dirname in dirnames
+                if not is_excluded(os.path.join(dirpath, dirname), exclude)
+            )
+            for filename in sorted(filenames):
+                file_path = os.path.join(dirpath, filename)
+                if filename.endswith('.py') and not is_excluded(file_path, exclude):
+                    yield file_path
+
+
+def is_excluded(path: str, exclude: Sequence[str]) -> bool:
+    return matches_filename(os.path.normpath(path), exclude, 'Is %(path)s excluded? %(whether)s', logger)
+
+
+def check_file(filename: str, changed_line_ranges: Optional[Sequence[LineRange]] = None) -> FileReport:
+    try:
+        with open(filename, 'rb') as file_handler:
+            source, file_size = read_source_with_classes(file_handler)
+    except OSError as error:
+        return get_read_error_report(filename, error)
+    if source is None:
+        return get_skipped_file_report(filename, file_size)
+    stats = Counter(files=1, checked_bytes=file_size)
+    return FileReport(filename, check_source(source, filename, changed_line_ranges, stats=stats), stats, [], Counter())
+
+
+def fix_file(filename: str, changed_line_ranges: Optional[Sequence[LineRange]] = None) -> FileReport:
+    try:
+        with open(filename, 'rb') as file_handler:
+            source, file_size = read_source_with_classes(file_handler)
+        if source is None:
+            return get_skipped_file_report(filename, file_size)
+        fixed_source, fix_stats = fix_source_bytes(source, filename, changed_line_ranges)
+        if fixed_source != source:
+            with open(filename, 'wb') as file_handler:
+                file_handler.write(fixed_source)
+    except OSError as error:
+        return get_read_error_report(filename, error)
+    stats = Counter(files=1, checked_bytes=file_size) + fix_stats
+    errors = check_source(fixed_source, filename, changed_line_ranges, stats=stats)
+    return FileReport(filename, errors, stats, [], Counter())
+
+
+def baseline_file(filename: str, changed_line_ranges: Optional[Sequence[LineRange]] = None) -> FileReport:
+    try:
+        with open(filename, 'rb') as file_handler:
+            source, file_size = read_source_with_classes(file_handler)
+    except OSError as error:
+        return get_read_error_report(filename, error)
+    if source is None:
+        return get_skipped_file_report(filename, file_size)
+    baseline_entries = get_baseline_entries(source, filename, changed_line_ranges)
+    stats = Counter(files=1, checked_bytes=file_size, baseline_entries=len(baseline_entries))
+    return FileReport(filename, [], +stats, baseline_entries, Counter())
+
+
+def count_file(filename: str, changed_line_ranges: Optional[Sequence[LineRange]] = None) -> FileReport:
+    try:
+        with open(filename, 'rb') as file_handler:
+            source, file_size = read_source_with_classes(file_handler)
+    except OSError as error:
+        return get_read_error_report(filename, error)
+    if source is None:
+        return get_skipped_file_report(filename, file_size)
+    stats = Counter(files=1, checked_bytes=file_size)
+    return FileReport(filename, [], stats, [], count_source_violations(source, filename, changed_line_ranges))
+
+
+def get_read_error_report(filename: str, error: OSError) -> FileReport:
+    return FileReport(filename, [(1, 0, f'E902 {type(error).__name__}: {error}')], Counter(files=1), [], Counter())
+
+
+def get_skipped_file_report(filename: str, file_size: int) -> FileReport:
+    return FileReport(filename, [], Counter(files=1, skipped_files=1, skipped_bytes=file_size), [], Counter())
+
+
+def get_baseline_entries(
+    source: bytes,
+    filename: str,
+    changed_line_ranges: Optional[Sequence[LineRange]] = None,
+) -> List[BaselineEntry]:
+    checker = get_source_checker(source, filename, changed_line_ranges)
+    if checker is None:
+        return []
+    options = ClassAttributesOrderChecker.options
+    baseline_directory = os.path.dirname(os.path.abspath(options.write_baseline)) if options else os.curdir
+    return list(checker.iter_baseline_entries(baseline_directory))
+
+
+def count_source_violations(
+    source: bytes,
+    filename: str,
+    changed_line_ranges: Optional[Sequence[LineRange]] = None,
+) -> Counter:
+    checker = get_source_checker(source, filename, changed_line_ranges)
+    if checker is None:
+        return Counter()
+    return Counter((qualname, error.code) for qualname, error in checker.iter_qualified_errors())
+
+
+def get_source_checker(
+    source: bytes,
+    filename: str,
+    changed_line_ranges: Optional[Sequence[LineRange]] = None,
+) -> Optional[ClassAttributesOrderChecker]:
+    lines = source.decode('utf-8', errors='replace').splitlines()
+    policy = ClassAttributesOrderChecker.ordering_policy
+    if any(NOQA_FILE.match(line) for line in lines) or is_generated_header(lines, policy.generated_markers):
+        return None
+    try:
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError):
+        return None
+    checker = ClassAttributesOrderChecker(tree, filename, lines)
+    checker.changed_line_ranges = changed_line_ranges
+    return checker
+
+
+def fix_source_bytes(
+    source: bytes,
+    filename: str,
+    changed_line_ranges: Optional[Sequence[LineRange]] = None,
+) -> Tuple[bytes, Counter]:
+    try:
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(source).readline)
+        text = source.decode(encoding)
+    except (SyntaxError, LookupError, UnicodeDecodeError):
+        return source, Counter()
+    lines = text.splitlines()
+    policy = ClassAttributesOrderChecker.ordering_policy
+    if any(NOQA_FILE.match(line) for line in lines) or is_generated_header(lines, policy.generated_markers):
+        return source, Counter()
+    fixed_text, fix_stats = fix_source(
+        text,
+        policy,
+        changed_line_ranges,
+        lambda error: is_inline_ignored(f'{error.code} ', filename, error.lineno, error.col_offset, lines),
+    )
+    return (fixed_text.encode(encoding) if fix_stats['fixed_files'] else source), fix_stats
+
+
+def check_files(
+    filenames: Sequence[str],
+    options: argparse.Namespace,
+    changed_line_ranges: Optional[Mapping[str, List[LineRange]]] = None,
+    worker: FileWorker = check_file,
+) -> Iterator[FileReport]:
+    files_line_ranges = [
+        changed_line_ranges.get(normalize_path(filename)) if changed_line_ranges is not None else None
+        for filename in filenames
+    ]
+    jobs = min(options.jobs, len(filenames))
+    if jobs <= 1:
+        init_worker(options)
+        yield from map(worker, filenames, files_line_ranges)
+        return
+    chunksize = max(1, len(filenames) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=(options,)) as executor:
+        yield from executor.map(worker, filenames, files_line_ranges, chunksize=chunksize)
+
+
+def init_worker(options: argparse.Namespace) -> None:
+    ClassAttributesOrderChecker.parse_options(options)
+
+
+def check_source(
+    source: bytes,
+    filename: str,
+    changed_line_ranges: Optional[Sequence[LineRange]] = None,
+    options: Optional[argparse.Namespace] = None,
+    stats: Optional[Counter] = None,
+) -> List[Tuple[int, int, str]]:
+    lines = source.decode('utf-8', errors='replace').splitlines()
+    policy = ClassAttributesOrderChecker.ordering_policy if options is None else get_ordering_policy(options)
+    if not policy.disable_noqa and any(NOQA_FILE.match(line) for line in lines):
+        return []
+    if is_generated_header(lines, policy.generated_markers):
+        if stats is not None:
+            stats['generated_files'] += 1
+        return []
+    errors = [
+        (lineno, col_offset, message)
+        for lineno, col_offset, message in get_checker_errors(source, filename, changed_line_ranges, options, stats)
+        if policy.disable_noqa or not is_inline_ignored(message, filename, lineno, col_offset, lines)
+    ]
+    return sorted(errors, key=lambda error: error[:2])
+
+
+def get_checker_errors(
+    source: bytes,
+    filename: str,
+    changed_line_ranges: Optional[Sequence[LineRange]] = None,
+    options: Optional[argparse.Namespace] = None,
+    stats: Optional[Counter] = None,
+) -> List[Tuple[int, int, str]]:
+    checker_options = options or ClassAttributesOrderChecker.options
+    result_cache = get_result_cache(checker_options)
+    if result_cache is None or changed_line_ranges is not None:
+        return run_checker(source, filename, changed_line_ranges, options, stats)
+    cache_key = get_cache_key(source, get_file_results_digest(get_ordering_policy(checker_options), filename))
+    errors = result_cache.load(cache_key)
+    if errors is None:
+        errors = run_checker(source, filename, options=options, stats=stats)
+        result_cache.store(cache_key, errors)
+    return errors
+
+
+def run_checker(
+    source: bytes,
+    filename: str,
+    changed_line_ranges: Optional[Sequence[LineRange]] = None,
+    options: Optional[argparse.Namespace] = None,
+    stats: Optional[Counter] = None,
+) -> List[Tuple[int, int, str]]:
+    policy = ClassAttributesOrderChecker.ordering_policy if options is None else get_ordering_policy(options)
+    return get_source_errors(filename, source, policy, changed_line_ranges, stats)
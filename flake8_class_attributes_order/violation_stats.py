@@ -0,0 +1,59 @@
+import csv
+import io
+import json
+import os
+from collections import Counter, defaultdict
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, NamedTuple
+
+from typing_extensions import DefaultDict, Final
+
+
+class ViolationStats(NamedTuple):
+    codes: Counter
+    directories: DefaultDict[str, Counter]
+    classes: DefaultDict[str, Counter]
+
+
+def create_violation_stats() -> ViolationStats:
+    return ViolationStats(Counter(), defaultdict(Counter), defaultdict(Counter))
+
+
+def merge_violation_counts(violation_stats: ViolationStats, path: str, violation_counts: Counter) -> None:
+    directory = os.path.dirname(path) or os.curdir
+    for (qualname, code), count in violation_counts.items():
+        violation_stats.codes[code] += count
+        violation_stats.directories[directory][code] += count
+        violation_stats.classes[f'{path}::{qualname}'][code] += count
+
+
+def format_violation_stats_json(violation_stats: ViolationStats) -> str:
+    return json.dumps({
+        'codes': dict(sorted(violation_stats.codes.items())),
+        'directories': get_sorted_counts(violation_stats.directories),
+        'classes': get_sorted_counts(violation_stats.classes),
+    }, indent=2) + '\n'
+
+
+def format_violation_stats_csv(violation_stats: ViolationStats) -> str:
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator='\n')
+    writer.writerow(('scope', 'name', 'code', 'count'))
+    writer.writerows(('total', '', code, count) for code, count in sorted(violation_stats.codes.items()))
+    for scope, counts_by_name in (('directory', violation_stats.directories), ('class', violation_stats.classes)):
+        writer.writerows(
+            (scope, name, code, count)
+            for name, codes in get_sorted_counts(counts_by_name).items()
+            for code, count in codes.items()
+        )
+    return output.getvalue()
+
+
+def get_sorted_counts(counts_by_name: Mapping[str, Counter]) -> Dict[str, Dict[str, int]]:
+    return {name: dict(sorted(counts.items())) for name, counts in sorted(counts_by_name.items())}
+
+
+VIOLATION_STATS_FORMATTERS: Final[Mapping[str, Callable[[ViolationStats], str]]] = MappingProxyType({
+    'json': format_violation_stats_json,
+    'csv': format_violation_stats_csv,
+})
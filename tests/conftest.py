@@ -6,7 +6,8 @@ from flake8_class_attributes_order.checker import ClassAttributesOrderChecker
 
 
 def run_validator_for_test_file(filename, max_annotations_complexity=None,
-                                strict_mode=False, attributes_order=None):
+                                strict_mode=False, attributes_order=None, ignore_docstring=False,
+                                **extra_options):
     test_file_path = os.path.join(
         os.path.dirname(os.path.abspath(__file__)),
         'test_files',
@@ -19,6 +20,9 @@ def run_validator_for_test_file(filename, max_annotations_complexity=None,
     options = Namespace()
     options.use_class_attributes_order_strict_mode = strict_mode
     options.class_attributes_order = attributes_order
+    options.ignore_docstring = ignore_docstring
+    for option_name, option_value in extra_options.items():
+        setattr(options, option_name, option_value)
     ClassAttributesOrderChecker.parse_options(options)
 
     checker = ClassAttributesOrderChecker(tree=tree, filename=filename)
@@ -0,0 +1,51 @@
+import pytest
+
+from flake8_class_attributes_order import CheckResult, build_ordering_policy, check_sources
+
+
+WRONG_ORDER_SOURCE = 'class A:\n    def foo(self):\n        pass\n\n    X = 1\n'
+
+
+def test_check_sources_streams_results_for_each_source():
+    results = check_sources([
+        ('errored.py', WRONG_ORDER_SOURCE),
+        ('noqa.py', WRONG_ORDER_SOURCE.replace('(self):', '(self):  # noqa: CCE001')),
+        ('broken.py', b'class A(:\n'),
+    ])
+    assert next(results) == CheckResult('errored.py', 2, 4, 'CCE001', 'A.foo should be after A.X')
+    broken_result = next(results)
+    assert (broken_result.name, broken_result.code) == ('broken.py', 'E999')
+    assert list(results) == []
+
+
+def test_check_sources_reports_noqa_errors_when_noqa_is_disabled():
+    sources = [
+        ('noqa.py', WRONG_ORDER_SOURCE.replace('(self):', '(self):  # noqa: CCE001')),
+        ('noqa_file.py', '# flake8: noqa\n' + WRONG_ORDER_SOURCE),
+    ]
+    assert list(check_sources(sources)) == []
+    assert [result.name for result in check_sources(sources, build_ordering_policy(disable_noqa=True))] == [
+        'noqa.py', 'noqa_file.py',
+    ]
+
+
+def test_check_sources_uses_given_policy():
+    source = (
+        'class A:\n'
+        '    @property\n    def _foo(self):\n        pass\n\n'
+        '    @property\n    def bar(self):\n        pass\n'
+    )
+    assert list(check_sources([('a.py', source)])) == []
+    strict_policy = build_ordering_policy(use_class_attributes_order_strict_mode=True)
+    assert [result.code for result in check_sources([('a.py', source)], strict_policy)] == ['CCE001']
+
+
+def test_build_ordering_policy_is_memoized():
+    assert build_ordering_policy(ignore_docstring=True) is build_ordering_policy(ignore_docstring=True)
+
+
+def test_build_ordering_policy_rejects_unknown_options():
+    with pytest.raises(TypeError):
+        build_ordering_policy(strict_mode=True)
+    with pytest.raises(ValueError):
+        build_ordering_policy(class_attributes_order_report_mode='all')
@@ -0,0 +1,110 @@
+from argparse import Namespace
+
+import pytest
+
+from flake8_class_attributes_order.autofix import fix_source
+from flake8_class_attributes_order.ordering_policy import get_ordering_policy
+from flake8_class_attributes_order.standalone import main
+
+
+UNORDERED_SOURCE = '''class User:
+    """User model."""
+
+    # CRM integration
+    @property
+    def crm_id(self):
+        return self.pk
+
+    def __init__(self):
+        self.pk = 1
+
+    LOGIN_FIELD = 'email'
+
+    class Meta:
+        def save(self):
+            pass
+
+        ordering = ['pk']
+'''
+
+FIXED_SOURCE = '''class User:
+    """User model."""
+
+    class Meta:
+        ordering = ['pk']
+
+        def save(self):
+            pass
+
+    LOGIN_FIELD = 'email'
+
+    def __init__(self):
+        self.pk = 1
+
+    # CRM integration
+    @property
+    def crm_id(self):
+        return self.pk
+'''
+
+
+@pytest.fixture()
+def policy():
+    return get_ordering_policy(Namespace(use_class_attributes_order_strict_mode=False, class_attributes_order=None))
+
+
+def test_fix_reorders_nested_classes_with_decorators_and_comments(policy):
+    fixed_source, stats = fix_source(UNORDERED_SOURCE, policy)
+    assert fixed_source == FIXED_SOURCE
+    assert stats == {'fixed_classes': 2, 'fixed_files': 1}
+
+
+def test_fix_moves_comments_indented_into_member_body(policy):
+    source = (
+        'class A:\n'
+        '    def run(self): return 1\n'
+        '        # trailing note about run\n'
+        '\n'
+        '    X = 1\n'
+        '    # leading note about Y\n'
+        '    Y = 2\n'
+    )
+    assert fix_source(source, policy).source == (
+        'class A:\n'
+        '    X = 1\n'
+        '\n'
+        '    # leading note about Y\n'
+        '    Y = 2\n'
+        '    def run(self): return 1\n'
+        '        # trailing note about run\n'
+    )
+
+
+def test_fix_is_idempotent(policy):
+    fixed_source, _ = fix_source(UNORDERED_SOURCE, policy)
+    assert fix_source(fixed_source, policy) == (fixed_source, {})
+
+
+@pytest.mark.parametrize('source', [
+    'class A:\n    def foo(self):\n        pass\n    X = 1; Y = 2\n',
+    'class A:\n    def foo(self):\n        pass\n    print(1)\n    X = 1\n',
+    'class A: X = 1; Meta = 2\n',
+    'class A(:\n',
+])
+def test_fix_leaves_unsafe_classes_unchanged(policy, source):
+    assert fix_source(source, policy).source == source
+
+
+def test_fix_preserves_line_endings_and_missing_final_newline(policy):
+    source = 'class A:\r\n    def foo(self):\r\n        pass\r\n\r\n    X = 1'
+    fixed_source, _ = fix_source(source, policy)
+    assert fixed_source == 'class A:\r\n    X = 1\r\n\r\n    def foo(self):\r\n        pass\r\n'
+
+
+def test_standalone_fix_rewrites_files(tmp_path, capsys):
+    (tmp_path / 'models.py').write_text(UNORDERED_SOURCE)
+    (tmp_path / 'noqa.py').write_text('class A:\n    def foo(self):  # noqa: CCE001\n        pass\n\n    X = 1\n')
+    assert main(['--isolated', '-j', '2', '--fix', '--show-run-stats', str(tmp_path)]) == 0
+    assert (tmp_path / 'models.py').read_text() == FIXED_SOURCE
+    assert (tmp_path / 'noqa.py').read_text().startswith('class A:\n    def foo')
+    assert 'fixed_classes: 2' in capsys.readouterr().err
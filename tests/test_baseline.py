@@ -0,0 +1,69 @@
+from flake8_class_attributes_order import build_ordering_policy, check_sources
+from flake8_class_attributes_order.baseline import format_baseline, get_file_baseline, parse_baseline
+from flake8_class_attributes_order.standalone import main
+
+
+LEGACY_MODULE = """
+class Legacy:
+    def foo(self):
+        pass
+
+    X = 1
+
+    class Nested:
+        def bar(self):
+            pass
+
+        Y = 2
+        print(Y)
+        print(Y)
+"""
+
+NEW_CLASS = """
+
+class Fresh:
+    def foo(self):
+        pass
+
+    X = 1
+"""
+
+
+def test_baseline_round_trip_keeps_entry_counts(tmp_path):
+    entries = [
+        ('pkg/a.py', 'A', 'foo', 'CCE001'),
+        ('pkg/a.py', 'A.B', '<class_level_expression>', 'CCE002'),
+        ('pkg/a.py', 'A.B', '<class_level_expression>', 'CCE002'),
+        ('pkg/b.py', 'f.<locals>.C', 'var1, var2', 'CCE001'),
+    ]
+    baseline = parse_baseline(format_baseline(entries), str(tmp_path))
+    assert sorted(baseline.file_entries) == ['pkg/a.py', 'pkg/b.py']
+    assert get_file_baseline(baseline, str(tmp_path / 'pkg' / 'a.py')) == {
+        ('A', 'foo', 'CCE001'): 1,
+        ('A.B', '<class_level_expression>', 'CCE002'): 2,
+    }
+    assert get_file_baseline(baseline, str(tmp_path / 'pkg' / 'c.py')) == {}
+
+
+def test_baseline_suppresses_known_errors_after_line_shifts(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'pkg').mkdir()
+    (tmp_path / 'pkg' / 'models.py').write_text(LEGACY_MODULE)
+    assert main(['--isolated', '-j', '1', '--write-baseline', 'baseline.txt', '.']) == 0
+    assert capsys.readouterr().out == ''
+
+    (tmp_path / 'pkg' / 'models.py').write_text('import os\n\n' + LEGACY_MODULE + NEW_CLASS)
+    assert main(['--isolated', '-j', '1', '--class-attributes-order-baseline', 'baseline.txt', '.']) == 1
+    assert capsys.readouterr().out == './pkg/models.py:20:5: CCE001 Fresh.foo should be after Fresh.X\n'
+
+
+def test_baseline_entries_are_counted(tmp_path):
+    (tmp_path / 'baseline.txt').write_text(format_baseline([
+        ('models.py', 'Legacy.Nested', '<class_level_expression>', 'CCE002'),
+        ('models.py', 'Legacy.Nested', 'bar', 'CCE001'),
+        ('models.py', 'Legacy', 'foo', 'CCE001'),
+        ('models.py', 'Legacy', 'X', 'CCE001'),
+    ]))
+    policy = build_ordering_policy(class_attributes_order_baseline=str(tmp_path / 'baseline.txt'))
+    results = check_sources([(str(tmp_path / 'models.py'), LEGACY_MODULE)], policy)
+    assert [(result.lineno, result.code) for result in results] == [(14, 'CCE002')]
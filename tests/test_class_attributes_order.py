@@ -193,3 +193,20 @@ def test_save_delete():
     assert errors[3][2] == 'CCE001 D.foo should be after D.__str__'
     assert errors[4][2] == 'CCE001 E.foo should be after E.save'
     assert errors[5][2] == 'CCE001 F.foo should be after F.delete'
+
+
+def test_outer_fields_detected_by_callable_name_and_import_alias():
+    errors = run_validator_for_test_file('outer_fields.py')
+    assert [error[2] for error in errors] == [
+        'CCE001 Author.organization should be after Author.name',
+        'CCE001 Book.author should be after Book.title',
+        'CCE001 Comment.content_object should be after Comment.text',
+    ]
+
+
+def test_configured_outer_fields():
+    errors = run_validator_for_test_file(
+        'outer_fields.py',
+        class_attributes_order_outer_fields=['TaggedRelation'],
+    )
+    assert [error[2] for error in errors] == ['CCE001 Tag.books should be after Tag.name']
@@ -0,0 +1,133 @@
+import ast
+import pathlib
+import sys
+
+from flake8_class_attributes_order import build_ordering_policy, check_sources
+from flake8_class_attributes_order.class_discovery import get_class_qualname, iter_class_defs
+
+
+SCOPES_SOURCE = """
+class Outer:
+    class Inner:
+        pass
+
+    def method(self):
+        class InMethod:
+            pass
+
+
+def factory():
+    class InFunction:
+        class NestedInFunction:
+            pass
+
+
+async def async_factory():
+    class InAsyncFunction:
+        pass
+
+
+try:
+    class InTry:
+        pass
+except ImportError:
+    class InHandler:
+        pass
+else:
+    class InElse:
+        pass
+finally:
+    class InFinally:
+        pass
+
+for value in ():
+    class InFor:
+        pass
+else:
+    class InForElse:
+        pass
+
+while False:
+    class InWhile:
+        pass
+
+with open(__file__):
+    if True:
+        class InWithIf:
+            pass
+    elif False:
+        class InElif:
+            pass
+
+TABLE = [{'key': (lambda: [x for x in range(3)])} for _ in range(3)]
+"""
+
+MATCH_SOURCE = """
+match value:
+    case 1:
+        class InCase:
+            pass
+"""
+
+WRONG_ORDER_CLASS = """
+class {0}:
+    def foo(self):
+        pass
+
+    X = 1
+"""
+
+
+def get_walked_class_names(tree):
+    return [node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
+
+
+def get_walked_class_qualnames(node, scope_prefix=''):
+    for child_node in ast.iter_child_nodes(node):
+        child_prefix = scope_prefix
+        if isinstance(child_node, ast.ClassDef):
+            yield child_node, f'{scope_prefix}{child_node.name}'
+            child_prefix = f'{scope_prefix}{child_node.name}.'
+        elif isinstance(child_node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            child_prefix = f'{scope_prefix}{child_node.name}.<locals>.'
+        yield from get_walked_class_qualnames(child_node, child_prefix)
+
+
+def test_classes_are_found_in_ast_walk_order():
+    tree = ast.parse(SCOPES_SOURCE + (MATCH_SOURCE if sys.version_info >= (3, 10) else ''))
+    assert [class_def.name for class_def in iter_class_defs(tree)] == get_walked_class_names(tree)
+
+
+def test_classes_are_found_in_ast_walk_order_in_repository_files():
+    repository_path = pathlib.Path(__file__).parent.parent
+    for directory_name in ('flake8_class_attributes_order', 'tests', 'benchmarks'):
+        for path in sorted((repository_path / directory_name).glob('**/*.py')):
+            tree = ast.parse(path.read_text())
+            assert [class_def.name for class_def in iter_class_defs(tree)] == get_walked_class_names(tree), path
+
+
+def test_class_qualnames_match_enclosing_scopes():
+    tree = ast.parse(SCOPES_SOURCE + (MATCH_SOURCE if sys.version_info >= (3, 10) else ''))
+    class_qualnames = dict(get_walked_class_qualnames(tree))
+    in_method_class_def = tree.body[0].body[1].body[0]
+    assert class_qualnames[in_method_class_def] == 'Outer.method.<locals>.InMethod'
+    for class_def, qualname in class_qualnames.items():
+        assert get_class_qualname(tree, class_def) == qualname
+
+
+def test_function_scopes_are_skipped():
+    class_names = [class_def.name for class_def in iter_class_defs(ast.parse(SCOPES_SOURCE), skip_function_scopes=True)]
+    assert 'Inner' in class_names
+    assert 'InWithIf' in class_names
+    assert not {'InMethod', 'InFunction', 'NestedInFunction', 'InAsyncFunction'} & set(class_names)
+
+
+def test_classes_in_functions_are_not_checked_with_option():
+    source = WRONG_ORDER_CLASS.format('Model') + '\n\ndef factory():' + WRONG_ORDER_CLASS.format('Local').replace(
+        '\n', '\n    ',
+    )
+    policy = build_ordering_policy(class_attributes_order_skip_function_scopes=True)
+    assert len(list(check_sources([('models.py', source)]))) == 2
+    assert [result.text for result in check_sources([('models.py', source)], policy)] == [
+        'Model.foo should be after Model.X',
+    ]
@@ -0,0 +1,99 @@
+import ast
+
+import pytest
+
+from flake8_class_attributes_order import build_ordering_policy, check_sources
+from flake8_class_attributes_order.model_parts_info import get_model_node_type
+from flake8_class_attributes_order.ordering_policy import get_classifier_context
+
+
+VALIDATED_MODEL = """
+class Model:
+    def clean(self):
+        pass
+
+    @validator('name')
+    def check_name(cls, value):
+        return value
+"""
+
+TEST_CASE = """
+class UserTest:
+    def test_login(self):
+        pass
+
+    def setUp(self):
+        pass
+"""
+
+
+CACHED_PROPERTY_MODEL = """
+class Model:
+    def run(self):
+        pass
+
+    @cached_property(ttl=60)
+    def value(self):
+        return 1
+"""
+
+
+def get_messages(source, **options):
+    return [result.text for result in check_sources([('model.py', source)], build_ordering_policy(**options))]
+
+
+def test_decorator_call_is_classified_by_rule():
+    assert get_messages(VALIDATED_MODEL) == []
+    assert get_messages(VALIDATED_MODEL, class_attributes_order_decorator_types=['validator:class_method']) == [
+        'Model.clean should be after Model.check_name',
+    ]
+
+
+def test_called_decorators_match_only_configured_rules():
+    assert get_messages(CACHED_PROPERTY_MODEL) == []
+    assert get_messages(
+        CACHED_PROPERTY_MODEL, class_attributes_order_decorator_types=['cached_property:property_method'],
+    ) == ['Model.run should be after Model.value']
+
+
+def test_decorator_rule_derives_visibility_types():
+    policy = build_ordering_policy(class_attributes_order_decorator_types=['hybrid_property:property_method'])
+    context = get_classifier_context(policy, {})
+    class_def = ast.parse(
+        'class A:\n'
+        '    @hybrid_property\n    def total(self): pass\n'
+        '    @sa.hybrid_property\n    def _total(self): pass\n'
+        '    @hybrid_property\n    def __total(self): pass\n',
+    ).body[0]
+    assert [get_model_node_type(node, context) for node in class_def.body] == [
+        'property_method', 'protected_property_method', 'private_property_method',
+    ]
+
+
+def test_method_name_rule():
+    assert get_messages(TEST_CASE) == []
+    assert get_messages(TEST_CASE, class_attributes_order_method_types=['setUp:__init__']) == [
+        'UserTest.test_login should be after UserTest.setUp',
+    ]
+
+
+def test_invalid_rules_are_ignored_with_warning():
+    with pytest.warns(Warning, match='is ignored'):
+        policy = build_ordering_policy(class_attributes_order_decorator_types=['broken', 'marker:unknown_type'])
+    assert 'broken' not in policy.decorator_types
+    assert 'marker' not in policy.decorator_types
+    assert policy.decorator_types['property'] == (
+        'property_method', 'protected_property_method', 'private_property_method',
+    )
+
+
+@pytest.mark.parametrize('rule_option, rule', [
+    ('class_attributes_order_method_types', 'foo:constant'),
+    ('class_attributes_order_decorator_types', 'bar:field'),
+    ('class_attributes_order_decorator_types', 'baz:nested_class'),
+])
+def test_rules_with_non_method_types_are_ignored(rule_option, rule):
+    with pytest.warns(Warning, match='is ignored'):
+        policy = build_ordering_policy(**{rule_option: [rule]})
+    source = 'class A:\n    @bar\n    def foo(self):\n        pass\n\n    @baz\n    def qux(self):\n        pass\n'
+    assert list(check_sources([('model.py', source)], policy)) == []
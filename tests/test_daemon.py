@@ -0,0 +1,87 @@
+import os
+import socket
+import threading
+import time
+from argparse import Namespace
+
+import pytest
+
+from flake8_class_attributes_order.daemon import request_check, serve
+
+
+ERRORED_SOURCE = 'class A:\n    def foo(self):\n        pass\n\n    X = 1\n'
+STRICT_ERRORED_SOURCE = (
+    'class A:\n'
+    '    @property\n'
+    '    def _foo(self):\n'
+    '        pass\n'
+    '\n'
+    '    @property\n'
+    '    def bar(self):\n'
+    '        pass\n'
+)
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    socket_path = str(tmp_path / 'checker.sock')
+    base_options = Namespace(
+        use_class_attributes_order_strict_mode=False,
+        class_attributes_order=None,
+        ignore_docstring=False,
+    )
+    server_thread = threading.Thread(target=serve, args=(socket_path, base_options, 0.5))
+    server_thread.start()
+    while not os.path.exists(socket_path):
+        time.sleep(0.01)
+    yield socket_path
+    server_thread.join(timeout=10)
+    assert not server_thread.is_alive()
+    assert not os.path.exists(socket_path)
+
+
+def test_daemon_checks_source_buffers(socket_path):
+    assert request_check(socket_path, 'errored.py', source=ERRORED_SOURCE) == [{
+        'line': 2,
+        'column': 5,
+        'code': 'CCE001',
+        'message': 'CCE001 A.foo should be after A.X',
+    }]
+
+
+def test_daemon_applies_request_options(socket_path):
+    assert not request_check(socket_path, 'strict.py', source=STRICT_ERRORED_SOURCE)
+    strict_diagnostics = request_check(
+        socket_path,
+        'strict.py',
+        source=STRICT_ERRORED_SOURCE,
+        options={'use_class_attributes_order_strict_mode': True},
+    )
+    assert [diagnostic['code'] for diagnostic in strict_diagnostics] == ['CCE001']
+
+
+def test_daemon_reads_files_and_reports_request_errors(socket_path, tmp_path):
+    source_path = tmp_path / 'errored.py'
+    source_path.write_text(ERRORED_SOURCE)
+    assert len(request_check(socket_path, str(source_path))) == 1
+    with pytest.raises(ValueError, match='Unknown option: unknown_option'):
+        request_check(socket_path, str(source_path), options={'unknown_option': True})
+
+
+def test_daemon_refuses_to_replace_a_running_daemon_socket(socket_path):
+    with pytest.raises(FileExistsError):
+        serve(socket_path, Namespace(), 0.5)
+    assert request_check(socket_path, 'errored.py', source='') == []
+
+
+def test_daemon_replaces_stale_socket(tmp_path):
+    socket_path = str(tmp_path / 'checker.sock')
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale_socket:
+        stale_socket.bind(socket_path)
+    not_socket_path = tmp_path / 'checker.txt'
+    not_socket_path.write_text('')
+    with pytest.raises(FileExistsError):
+        serve(str(not_socket_path), Namespace(), 0.5)
+    assert not_socket_path.exists()
+    serve(socket_path, Namespace(use_class_attributes_order_strict_mode=False, class_attributes_order=None), 0.1)
+    assert not os.path.exists(socket_path)
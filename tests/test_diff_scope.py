@@ -0,0 +1,104 @@
+import subprocess
+
+from flake8_class_attributes_order.diff_scope import parse_unified_diff
+from flake8_class_attributes_order.standalone import main
+
+
+TWO_ERRORED_CLASSES_SOURCE = (
+    'class A:\n'
+    '    def foo(self):\n'
+    '        pass\n'
+    '\n'
+    '    X = 1\n'
+    '\n'
+    '\n'
+    'class B:\n'
+    '    def foo(self):\n'
+    '        pass\n'
+    '\n'
+    '    X = 1\n'
+)
+
+DIFF_TEXT = """diff --git a/models.py b/models.py
+--- a/models.py
++++ b/models.py
+@@ -10,1 +10,2 @@ class B:
+-        pass
++        return 1
++
+@@ -20,3 +21,0 @@
+-    a = 1
+-    b = 2
+-    c = 3
+--- a/removed.py
++++ /dev/null
+@@ -1,2 +0,0 @@
+-x = 1
+-y = 2
+--- a/other.py
++++ b/other.py
+@@ -0,0 +1 @@
++z = 3
+"""
+
+
+def test_parse_unified_diff():
+    assert parse_unified_diff(DIFF_TEXT) == {
+        'models.py': [(10, 12), (21, 22)],
+        'other.py': [(1, 2)],
+    }
+
+
+def test_parse_unified_diff_ignores_added_lines_looking_like_headers():
+    diff_text = (
+        '--- a/m.py\n+++ b/m.py\n'
+        '@@ -1,1 +1,4 @@\n--- removed\n+++ not a header\n+y = 2\n+z = 3\n+w = 4\n'
+        '@@ -10 +12 @@\n-v = 4\n+v = 5\n\\ No newline at end of file\n'
+        '--- a/n.py\n+++ b/n.py\n@@ -3,2 +3,2 @@\n a = 1\n-b = 2\n+b = 3\n'
+    )
+    assert parse_unified_diff(diff_text) == {'m.py': [(1, 5), (12, 13)], 'n.py': [(3, 5)]}
+
+
+def test_diff_mode_reports_only_touched_classes(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'models.py').write_text(TWO_ERRORED_CLASSES_SOURCE)
+    (tmp_path / 'untouched.py').write_text(TWO_ERRORED_CLASSES_SOURCE)
+    (tmp_path / 'changes.diff').write_text(DIFF_TEXT)
+    assert main(['--isolated', '-j', '1', '--diff', 'changes.diff']) == 1
+    assert capsys.readouterr().out == './models.py:9:5: CCE001 B.foo should be after B.X\n'
+
+
+def test_diff_revision_mode_uses_git_diff(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    git_command = ['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com']
+    subprocess.run([*git_command, 'init', '-q'], check=True)
+    (tmp_path / 'models.py').write_text(TWO_ERRORED_CLASSES_SOURCE)
+    subprocess.run([*git_command, 'add', 'models.py'], check=True)
+    subprocess.run([*git_command, 'commit', '-q', '-m', 'init'], check=True)
+    (tmp_path / 'models.py').write_text(TWO_ERRORED_CLASSES_SOURCE.replace('    X = 1\n', '    X = 2\n', 1))
+    assert main(['--isolated', '-j', '1', '--diff-revision', 'HEAD']) == 1
+    assert capsys.readouterr().out == './models.py:2:5: CCE001 A.foo should be after A.X\n'
+
+
+def test_diff_errors_are_reported_without_traceback(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('GIT_CEILING_DIRECTORIES', str(tmp_path.parent))
+    (tmp_path / 'models.py').write_text(TWO_ERRORED_CLASSES_SOURCE)
+    assert main(['--isolated', '-j', '1', '--diff-revision', 'HEAD']) == 2
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert 'Not a git repository' in captured.err
+    assert len(captured.err.splitlines()) == 1
+
+    subprocess.run(['git', 'init', '-q'], check=True)
+    assert main(['--isolated', '-j', '1', '--diff-revision', 'unknown-revision']) == 2
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert captured.err.startswith('fatal: ')
+    assert 'unknown-revision' in captured.err
+    assert len(captured.err.splitlines()) == 1
+
+    assert main(['--isolated', '-j', '1', '--diff', 'missing.diff']) == 2
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert captured.err == "[Errno 2] No such file or directory: 'missing.diff'\n"
@@ -0,0 +1,351 @@
+import ast
+import random
+from argparse import Namespace
+from typing import NamedTuple, Tuple
+
+import pytest
+
+from flake8_class_attributes_order import build_ordering_policy, check_sources
+from flake8_class_attributes_order.checker import ClassAttributesOrderChecker
+from flake8_class_attributes_order.node_type_weights import (
+    CONFIGURABLE_NODE_TYPES, FIXED_NODE_TYPE_WEIGHTS, NON_STRICT_NODE_TYPE_WEIGHTS, STRICT_NODE_TYPE_WEIGHTS,
+)
+from flake8_class_attributes_order.ordering_policy import POLICY_OPTIONS_DEFAULTS
+
+
+FUZZ_MODULES_PER_CASE = 150
+
+MODULE_HEADER = (
+    'import abc',
+    'from django.db import models',
+    'from django.db.models import ForeignKey as FK, OneToOneField',
+)
+
+CUSTOM_ORDER = [
+    'constant', 'field', 'outer_field', 'meta_class', 'nested_class', 'magic_method', 'property_method',
+    'static_method', 'class_method', 'method', 'protected_method', 'private_method',
+]
+
+MODES = {
+    'default': {},
+    'strict': {'use_class_attributes_order_strict_mode': True},
+    'custom': {'class_attributes_order': CUSTOM_ORDER},
+    'ignore-docstring': {'ignore_docstring': True},
+    'strict-ignore-docstring': {'use_class_attributes_order_strict_mode': True, 'ignore_docstring': True},
+}
+
+REFERENCE_SPECIAL_METHOD_NAMES = frozenset(('__new__', '__init__', '__post_init__', '__str__', 'save', 'delete'))
+
+REFERENCE_DECORATOR_TYPES = {
+    'property': 'property_method',
+    'cached_property': 'property_method',
+    'setter': 'property_method',
+    'deleter': 'property_method',
+    'staticmethod': 'static_method',
+    'classmethod': 'class_method',
+}
+
+REFERENCE_FIXED_NODE_NAMES = {
+    'docstring': 'docstring',
+    'meta_class': 'Meta',
+    'expression': '<class_level_expression>',
+    'if': 'if ...',
+    'pass': None,
+}
+
+REFERENCE_OUTER_FIELD_NAMES = frozenset((
+    'ForeignKey', 'ManyToManyField', 'OneToOneField', 'GenericRelation', 'GenericForeignKey',
+))
+
+ASSIGNMENT_TARGETS = (
+    'name_{0}', 'NAME_{0}', '_hidden_{0}', '_{0}', 'Mixed_{0}', 'a_{0}, b_{0}', 'obj.attr_{0}', "table['{0}']",
+)
+ASSIGNMENT_VALUES = (
+    '{0}',
+    '"text"',
+    'models.CharField(max_length={0})',
+    'models.ForeignKey("Other", on_delete=models.CASCADE)',
+    'FK("Other")',
+    'OneToOneField("Other")',
+    'ManyToManyField("Other")',
+    'models.Manager()',
+    'factory()()',
+    'lambda: {0}',
+)
+ANNOTATION_TARGETS = ('name_{0}', 'NAME_{0}', '_hidden_{0}', "table['{0}']")
+FUNCTION_NAMES = (
+    'method_{0}', '_protected_{0}', '__private_{0}', '__magic_{0}__', '__init__', '__new__', '__post_init__', '__str__',
+    'save', 'delete', '_', '__',
+)
+DECORATORS = (
+    'property', 'cached_property', 'staticmethod', 'classmethod', 'value.setter', 'value.deleter',
+    'abc.abstractmethod', "validator('name')", 'functools.wraps(f)', 'decorators[0]', 'cached_property(ttl=60)',
+    'staticmethod()',
+)
+EXPRESSIONS = ('"""Docstring."""', '{0}', 'print({0})', 'register(name_{0})', '...')
+
+
+class Snippet(NamedTuple):
+    lines: Tuple[str, ...]
+    # members of a class defined by the lines, indented relative to the first line
+    body_indent: int
+    body: Tuple['Snippet', ...]
+
+
+def test_fuzzing_is_reproducible():
+    assert generate_module(random.Random(0)) == generate_module(random.Random(0))
+
+
+def test_shrinking_keeps_only_failing_members():
+    module = (
+        generate_class(random.Random(1), 'First', 1),
+        Snippet(('class Second:',), 4, (get_statement('x = 1'), get_statement('def save(self):', '    pass'))),
+    )
+
+    shrunk_module = shrink_snippets(module, lambda snippets: 'def save' in render_snippets(snippets))
+
+    assert shrunk_module == (Snippet(('class Second:',), 4, (get_statement('def save(self):', '    pass'),)),)
+
+
+@pytest.mark.parametrize('engine_name', ['flake8', 'api'])
+@pytest.mark.parametrize('mode', [*MODES, 'shuffled-order'])
+def test_engine_matches_reference(engine_name, mode):
+    engine = ENGINES[engine_name]
+    randomizer = random.Random(f'{engine_name}:{mode}')
+    for _ in range(FUZZ_MODULES_PER_CASE):
+        options = get_shuffled_order_options(randomizer) if mode == 'shuffled-order' else MODES[mode]
+        module = generate_module(randomizer)
+        if is_mismatched(engine, options, module):
+            module = shrink_snippets(
+                module, lambda snippets, options=options: is_mismatched(engine, options, snippets),
+            )
+            source = render_snippets(module)
+            pytest.fail(
+                f'{engine_name} engine differs from reference with {options} on:\n{source}\n'
+                f'reference: {check_reference(source, options)}\n{engine_name}: {engine(source, options)}',
+            )
+
+
+def get_shuffled_order_options(randomizer):
+    node_types = list(CONFIGURABLE_NODE_TYPES)
+    return {'class_attributes_order': randomizer.sample(node_types, randomizer.randint(1, len(node_types)))}
+
+
+def is_mismatched(engine, options, snippets):
+    source = render_snippets(snippets)
+    return engine(source, options) != check_reference(source, options)
+
+
+def run_flake8_checker(source, options):
+    ClassAttributesOrderChecker.parse_options(Namespace(**{**POLICY_OPTIONS_DEFAULTS, **options}))
+    checker = ClassAttributesOrderChecker(ast.parse(source), 'fuzzed.py')
+    return sorted(error[:3] for error in checker.run())
+
+
+def run_check_sources(source, options):
+    return sorted(
+        (result.lineno, result.col_offset, f'{result.code} {result.text}')
+        for result in check_sources([('fuzzed.py', source)], build_ordering_policy(**options))
+    )
+
+
+ENGINES = {
+    'flake8': run_flake8_checker,
+    'api': run_check_sources,
+}
+
+
+def generate_module(randomizer):
+    return tuple(
+        generate_class(randomizer, f'Fuzzed{class_index}', depth=0)
+        for class_index in range(randomizer.randint(1, 3))
+    )
+
+
+def generate_class(randomizer, name, depth):
+    members = tuple(generate_member(randomizer, depth) for _ in range(randomizer.randint(0, 10)))
+    return Snippet((f'class {name}(models.Model):',), 4, members)
+
+
+def generate_member(randomizer, depth):  # noqa: CFQ004
+    member_index = randomizer.randrange(100)
+    member_kind = randomizer.choice(('assign', 'assign', 'annotated', 'def', 'def', 'class', 'if', 'expression'))
+    if member_kind == 'assign':
+        target = randomizer.choice(ASSIGNMENT_TARGETS)
+        value = randomizer.choice(ASSIGNMENT_VALUES)
+        return get_statement(f'{target} = {value}'.format(member_index))
+    if member_kind == 'annotated':
+        value = randomizer.choice(('', ' = {0}', ' = models.ForeignKey("Other")'))
+        return get_statement(f'{randomizer.choice(ANNOTATION_TARGETS)}: int{value}'.format(member_index))
+    if member_kind == 'def':
+        return generate_function(randomizer, member_index, depth)
+    if member_kind == 'class' and depth < 2:
+        return generate_class(randomizer, randomizer.choice(('Meta', f'Nested{member_index}')), depth + 1)
+    if member_kind == 'if':
+        return get_statement(
+            randomizer.choice(('if {0}:', 'if {0}:\n    pass\nelse:')).format(member_index),
+            '    value = {0}'.format(member_index),
+        )
+    return get_statement(randomizer.choice(EXPRESSIONS + ('pass',)).format(member_index))
+
+
+def generate_function(randomizer, member_index, depth):
+    decorators = tuple(f'@{randomizer.choice(DECORATORS)}' for _ in range(randomizer.choice((0, 0, 1, 1, 2))))
+    prefix = randomizer.choice(('', '', 'async '))
+    header = (*decorators, f'{prefix}def {randomizer.choice(FUNCTION_NAMES).format(member_index)}(self):')
+    if depth < 2 and randomizer.random() < 0.1:
+        local_class = generate_class(randomizer, f'Local{member_index}', depth + 1)
+        return Snippet((*header, *(f'    {line}' for line in local_class.lines)), 8, local_class.body)
+    return get_statement(*header, '    return self')
+
+
+def get_statement(*lines):
+    return Snippet(lines, 0, ())
+
+
+def render_snippets(snippets):
+    return ''.join(f'{line}\n' for line in (*MODULE_HEADER, *iter_snippet_lines(snippets, indent='')))
+
+
+def iter_snippet_lines(snippets, indent):
+    for snippet in snippets:
+        for line in snippet.lines:
+            yield from (f'{indent}{physical_line}' for physical_line in line.splitlines())
+        if snippet.body_indent:
+            body_indent = indent + ' ' * snippet.body_indent
+            yield from iter_snippet_lines(snippet.body, body_indent) if snippet.body else (f'{body_indent}pass',)
+
+
+def shrink_snippets(snippets, is_failing):
+    snippet_index = 0
+    while snippet_index < len(snippets):
+        reduced_snippets = snippets[:snippet_index] + snippets[snippet_index + 1:]
+        if is_failing(reduced_snippets):
+            snippets = reduced_snippets
+            continue
+        snippet = snippets[snippet_index]
+        if snippet.body:
+            snippets = replace_snippet(snippets, snippet_index, snippet._replace(body=shrink_snippets(
+                snippet.body,
+                lambda body, index=snippet_index, outer=snippets: is_failing(
+                    replace_snippet(outer, index, outer[index]._replace(body=body)),
+                ),
+            )))
+        snippet_index += 1
+    return snippets
+
+
+def replace_snippet(snippets, snippet_index, snippet):
+    return snippets[:snippet_index] + (snippet,) + snippets[snippet_index + 1:]
+
+
+def check_reference(source, options):
+    tree = ast.parse(source)
+    weights = get_reference_weights(options)
+    imported_names = get_reference_imported_names(tree)
+    errors = []
+    for class_def in ast.walk(tree):
+        if not isinstance(class_def, ast.ClassDef):
+            continue
+        members = [
+            (node, node_type)
+            for node, node_type in ((node, get_reference_node_type(node, imported_names)) for node in class_def.body)
+            if node_type in weights
+        ]
+        for member_index, (node, node_type) in enumerate(members):
+            if member_index + 1 < len(members) and weights[node_type] > weights[members[member_index + 1][1]]:
+                next_node, next_node_type = members[member_index + 1]
+                errors.append((node.lineno, node.col_offset, 'CCE001 {0}.{1} should be after {0}.{2}'.format(
+                    class_def.name,
+                    get_reference_node_name(node, node_type),
+                    get_reference_node_name(next_node, next_node_type),
+                )))
+            if node_type in ('expression', 'if'):
+                errors.append((
+                    node.lineno,
+                    node.col_offset,
+                    f'CCE002 Class level expression detected in class {class_def.name}, line {node.lineno}',
+                ))
+    return sorted(errors)
+
+
+def get_reference_weights(options):
+    if options.get('class_attributes_order'):
+        weights = dict(FIXED_NODE_TYPE_WEIGHTS)
+        configured_weights = {
+            node_type: weight
+            for weight, node_type in enumerate(options['class_attributes_order'], start=len(weights))
+        }
+        for node_type, node_type_path in CONFIGURABLE_NODE_TYPES.items():
+            configured_types = [node_type for node_type in node_type_path if node_type in configured_weights]
+            if configured_types:
+                weights[node_type] = configured_weights[configured_types[0]]
+    elif options.get('use_class_attributes_order_strict_mode'):
+        weights = dict(STRICT_NODE_TYPE_WEIGHTS)
+    else:
+        weights = dict(NON_STRICT_NODE_TYPE_WEIGHTS)
+    if options.get('ignore_docstring'):
+        del weights['docstring']
+    return weights
+
+
+def get_reference_imported_names(tree):
+    imported_names = {}
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            imported_names.update({alias.asname or alias.name: f'{node.module}.{alias.name}' for alias in node.names})
+        elif isinstance(node, ast.Import):
+            imported_names.update({alias.asname: alias.name for alias in node.names if alias.asname})
+    return imported_names
+
+
+def get_reference_node_type(node, imported_names):  # noqa: CFQ004
+    if isinstance(node, (ast.Assign, ast.AnnAssign)):
+        return get_reference_assignment_type(node, imported_names)
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return get_reference_funcdef_type(node)
+    if isinstance(node, ast.Expr):
+        return 'docstring' if isinstance(node.value, ast.Constant) else 'expression'
+    if isinstance(node, ast.ClassDef):
+        return 'meta_class' if node.name == 'Meta' else 'nested_class'
+    return {ast.If: 'if', ast.Pass: 'pass'}.get(type(node))
+
+
+def get_reference_assignment_type(node, imported_names):
+    target = node.target if isinstance(node, ast.AnnAssign) else node.targets[0]
+    if isinstance(node.value, ast.Call) and isinstance(node.value.func, (ast.Name, ast.Attribute)):
+        func = node.value.func
+        callable_name = func.attr if isinstance(func, ast.Attribute) else imported_names.get(func.id, func.id)
+        if callable_name.split('.')[-1] in REFERENCE_OUTER_FIELD_NAMES:
+            return 'outer_field'
+    if isinstance(target, ast.Name) and target.id == target.id.upper():
+        return 'constant'
+    return 'expression' if isinstance(target, ast.Subscript) else 'field'
+
+
+def get_reference_funcdef_type(node):  # noqa: CFQ004
+    visibility_prefix = 'private_' if node.name.startswith('__') else 'protected_' if node.name.startswith('_') else ''
+    for decorator in node.decorator_list:
+        decorator_name = getattr(decorator, 'attr', None) or getattr(decorator, 'id', None)
+        if decorator_name in REFERENCE_DECORATOR_TYPES:
+            return f'{visibility_prefix}{REFERENCE_DECORATOR_TYPES[decorator_name]}'
+    if node.name in REFERENCE_SPECIAL_METHOD_NAMES:
+        return node.name
+    if node.name.startswith('__') and node.name.endswith('__'):
+        return 'magic_method'
+    return f'{visibility_prefix}method'
+
+
+def get_reference_node_name(node, node_type):  # noqa: CFQ004
+    if node_type in REFERENCE_FIXED_NODE_NAMES:
+        return REFERENCE_FIXED_NODE_NAMES[node_type]
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return node.name
+    target = node.target if isinstance(node, ast.AnnAssign) else node.targets[0]
+    if isinstance(target, ast.Name):
+        return target.id
+    if isinstance(target, ast.Attribute) and isinstance(node, ast.Assign):
+        return target.attr
+    if isinstance(target, ast.Tuple) and isinstance(node, ast.Assign):
+        return ', '.join(element.id for element in target.elts if isinstance(element, ast.Name))
+    return '<class_level_assignment>'
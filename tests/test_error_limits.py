@@ -0,0 +1,58 @@
+import ast
+from argparse import Namespace
+
+import pytest
+
+from conftest import run_validator_for_test_file
+from flake8_class_attributes_order import checker
+from flake8_class_attributes_order.checker import ClassAttributesOrderChecker
+from flake8_class_attributes_order.standalone import main
+
+
+def test_max_errors_per_class():
+    errors = run_validator_for_test_file('errored.py', class_attributes_order_max_errors_per_class=1)
+    assert [error[2][:6] for error in errors] == ['CCE001', 'CCE001', 'CCE002']
+
+
+def test_max_errors_per_file():
+    errors = run_validator_for_test_file('errored.py', class_attributes_order_max_errors_per_file=2)
+    assert errors == run_validator_for_test_file('errored.py')[:2]
+
+
+def test_fail_fast_stops_at_first_wrong_order():
+    errors = run_validator_for_test_file('errored.py', class_attributes_order_fail_fast=True)
+    assert [error[2] for error in errors] == [
+        'CCE001 Foo.<class_level_expression> should be after Foo.var1, var2',
+    ]
+
+
+def test_errors_are_generated_lazily(monkeypatch):
+    classified_classes = []
+
+    def get_model_parts_info(class_def, *args):
+        classified_classes.append(class_def.name)
+        return original_get_model_parts_info(class_def, *args)
+
+    original_get_model_parts_info = checker.get_model_parts_info
+    monkeypatch.setattr(checker, 'get_model_parts_info', get_model_parts_info)
+    ClassAttributesOrderChecker.parse_options(Namespace(
+        use_class_attributes_order_strict_mode=False,
+        class_attributes_order=None,
+    ))
+    tree = ast.parse('class A:\n    def foo(self):\n        pass\n    X = 1\n\n\nclass B:\n    pass\n')
+    errors = ClassAttributesOrderChecker(tree, 'lazy.py').run()
+    assert next(errors)[2] == 'CCE001 A.foo should be after A.X'
+    assert classified_classes == ['A']
+
+
+@pytest.mark.parametrize('limit_option', [
+    '--class-attributes-order-max-errors-per-file=1',
+    '--class-attributes-order-fail-fast',
+])
+def test_inline_ignored_errors_do_not_use_up_limits(tmp_path, capsys, limit_option):
+    (tmp_path / 'models.py').write_text(
+        'class A:\n    def foo(self):  # noqa: CCE001\n        pass\n\n    X = 1\n\n\n'
+        'class B:\n    def bar(self):\n        pass\n\n    Y = 1\n',
+    )
+    assert main(['--isolated', '-j', '1', limit_option, str(tmp_path)]) == 1
+    assert capsys.readouterr().out == f'{tmp_path / "models.py"}:9:5: CCE001 B.bar should be after B.Y\n'
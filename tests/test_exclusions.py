@@ -0,0 +1,85 @@
+import ast
+import json
+
+from conftest import run_validator_for_test_file
+from flake8_class_attributes_order import build_ordering_policy, check_sources
+from flake8_class_attributes_order.checker import ClassAttributesOrderChecker
+from flake8_class_attributes_order.profiling import get_profiler
+from flake8_class_attributes_order.standalone import main
+
+
+WRONG_ORDER_CLASS = 'class {0}({1}):\n    def foo(self):\n        pass\n\n    X = 1\n\n\n'
+
+
+def test_classes_excluded_by_name_pattern():
+    errors = run_validator_for_test_file('errored.py', class_attributes_order_exclude_classes=['User.*', 'Bar'])
+    assert [error[2] for error in errors] == [
+        'CCE001 Foo.<class_level_expression> should be after Foo.var1, var2',
+        'CCE002 Class level expression detected in class Foo, line 13',
+    ]
+
+
+def test_classes_excluded_by_base_name():
+    source = 'from pydantic import BaseModel as Model\nimport typing\n\n\n' + ''.join([
+        WRONG_ORDER_CLASS.format('Schema', 'Model'),
+        WRONG_ORDER_CLASS.format('Nested', 'typing.BaseModel'),
+        WRONG_ORDER_CLASS.format('Generic', 'BaseModel[int]'),
+        WRONG_ORDER_CLASS.format('Checked', 'object'),
+    ])
+    policy = build_ordering_policy(class_attributes_order_exclude_bases=['BaseModel'])
+    assert [result.text for result in check_sources([('schemas.py', source)], policy)] == [
+        'Checked.foo should be after Checked.X',
+    ]
+
+
+def test_generated_sources_are_skipped():
+    source = '# Generated by the protocol buffer compiler.  DO NOT EDIT!\n' + WRONG_ORDER_CLASS.format('A', '')
+    assert len(list(check_sources([('a_pb2.py', source)]))) == 1
+    policy = build_ordering_policy(class_attributes_order_generated_markers=['Generated by', '@generated'])
+    assert list(check_sources([('a_pb2.py', source)], policy)) == []
+
+
+def test_plugin_skips_generated_files_by_lines():
+    source = '# @generated\n' + WRONG_ORDER_CLASS.format('A', '')
+    checker = ClassAttributesOrderChecker(ast.parse(source), 'a.py', source.splitlines(keepends=True))
+    checker.ordering_policy = build_ordering_policy(class_attributes_order_generated_markers=['@generated'])
+    assert list(checker.run()) == []
+    assert checker.stats == {'generated_files': 1}
+
+
+def test_plugin_counts_skipped_files_and_classes_in_profile(tmp_path, monkeypatch):
+    profile_path = str(tmp_path / 'profile.json')
+    monkeypatch.setattr(ClassAttributesOrderChecker, 'profile_path', profile_path)
+    policy = build_ordering_policy(
+        class_attributes_order_generated_markers=['@generated'],
+        class_attributes_order_exclude_classes=['Legacy.*'],
+    )
+    sources = [
+        '# @generated\n' + WRONG_ORDER_CLASS.format('A', ''),
+        WRONG_ORDER_CLASS.format('LegacyA', '') + WRONG_ORDER_CLASS.format('B', ''),
+    ]
+    for source in sources:
+        checker = ClassAttributesOrderChecker(ast.parse(source), 'a.py', source.splitlines(keepends=True))
+        checker.ordering_policy = policy
+        list(checker.run())
+    get_profiler(profile_path).flush()
+
+    with open(profile_path) as profile_file:
+        counters = json.load(profile_file)['counters']
+    assert counters['generated_files'] == 1
+    assert counters['excluded_classes'] == 1
+
+
+def test_standalone_counts_skipped_files_and_classes(tmp_path, capsys):
+    (tmp_path / 'models_pb2.py').write_text('# @generated\n' + WRONG_ORDER_CLASS.format('A', ''))
+    (tmp_path / 'models.py').write_text(WRONG_ORDER_CLASS.format('LegacyA', '') + WRONG_ORDER_CLASS.format('B', ''))
+    assert main([
+        '--isolated', '-j', '1', '--show-run-stats',
+        '--class-attributes-order-generated-markers', '@generated',
+        '--class-attributes-order-exclude-classes', 'Legacy.*',
+        str(tmp_path),
+    ]) == 1
+    captured = capsys.readouterr()
+    assert len(captured.out.splitlines()) == 1
+    assert 'generated_files: 1' in captured.err
+    assert 'excluded_classes: 1' in captured.err
@@ -0,0 +1,36 @@
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.db import models
+from django.db.models import ForeignKey as FK
+
+from factories import MyForeignKeyFactory
+from mptt.fields import TreeForeignKey
+
+
+class Author(models.Model):
+    organization = FK('Organization', on_delete=models.CASCADE)
+    name = models.CharField(max_length=255)
+
+
+class Book(models.Model):
+    author = models.ForeignKey(Author, on_delete=models.CASCADE)
+    title = models.CharField(max_length=255)
+
+
+class BookFactory:
+    author = MyForeignKeyFactory()
+    title = 'Title'
+
+
+class Tag(models.Model):
+    books = TaggedRelation(Book)
+    name = models.CharField(max_length=255)
+
+
+class Comment(models.Model):
+    content_object = GenericForeignKey('content_type', 'object_id')
+    text = models.TextField()
+
+
+class Category(models.Model):
+    parent = TreeForeignKey('self', on_delete=models.CASCADE)
+    name = models.CharField(max_length=255)
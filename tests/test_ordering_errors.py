@@ -0,0 +1,96 @@
+import ast
+import itertools
+import random
+
+import pytest
+
+from conftest import run_validator_for_test_file
+from flake8_class_attributes_order import build_ordering_policy, checker
+from flake8_class_attributes_order.model_parts_info import (
+    NODE_NAME_GETTERS, ModelPart, get_model_parts_info, get_node_name,
+)
+from flake8_class_attributes_order.ordering_errors import (
+    get_longest_non_decreasing_subsequence, iter_minimal_move_errors,
+)
+
+
+def test_messages_are_formatted_only_for_emitted_errors(monkeypatch):
+    formatted_errors = []
+
+    def format_ordering_error(error):
+        formatted_errors.append(error)
+        return original_format_ordering_error(error)
+
+    original_format_ordering_error = checker.format_ordering_error
+    monkeypatch.setattr(checker, 'format_ordering_error', format_ordering_error)
+    errors = run_validator_for_test_file('errored.py', class_attributes_order_max_errors_per_file=1)
+    assert len(errors) == len(formatted_errors) == 1
+
+
+def test_ignored_codes_are_not_reported():
+    errors = run_validator_for_test_file(
+        'errored.py',
+        select=None,
+        extend_select=None,
+        extended_default_select=['CCE'],
+        ignore=None,
+        extend_ignore=['CCE002'],
+        extended_default_ignore=[],
+    )
+    assert errors
+    assert all(error[2].startswith('CCE001') for error in errors)
+
+
+def test_node_name_getters_cover_known_node_types():
+    assert 'private_property_method' in NODE_NAME_GETTERS
+    assert get_node_name(None, 'docstring') == 'docstring'
+    assert get_node_name(None, 'unknown_expression') == '<class_level_expression>'
+
+
+def test_minimal_moves_report_only_misplaced_members():
+    errors = run_validator_for_test_file('errored.py', class_attributes_order_report_mode='minimal-moves')
+    assert [error[2] for error in errors if error[2].startswith('CCE001')] == [
+        'CCE001 Foo.<class_level_expression> should be moved after Foo.var1, var2',
+        'CCE001 User.fetch_info_from_crm should be moved after User.LOGIN_FIELD',
+    ]
+
+
+@pytest.mark.parametrize('weights, expected_moves', [
+    ([26, 4, 4, 5], ['0 after 3']),
+    ([26, 27, 4], ['2 before 0']),
+    ([4, 26, 10, 12, 13], ['1 after 4']),
+    ([1, 2, 3], []),
+])
+def test_minimal_move_errors(weights, expected_moves):
+    model_parts_info = [ModelPart('A', None, 'pass', weight, 1, 0) for weight in weights]
+    moves = []
+    for error in iter_minimal_move_errors(model_parts_info):
+        relation = 'after' if weights[error.anchor_index] <= weights[error.part_index] else 'before'
+        moves.append(f'{error.part_index} {relation} {error.anchor_index}')
+    assert moves == expected_moves
+
+
+def test_longest_non_decreasing_subsequence_is_longest():
+    random_generator = random.Random(0)
+    for _ in range(200):
+        weights = [random_generator.randint(0, 5) for _ in range(random_generator.randint(0, 8))]
+        subsequence = get_longest_non_decreasing_subsequence(weights)
+        assert subsequence == sorted(subsequence)
+        assert [weights[index] for index in subsequence] == sorted(weights[index] for index in subsequence)
+        assert len(subsequence) == max(
+            (
+                len(indexes) for indexes in itertools.chain.from_iterable(
+                    itertools.combinations(range(len(weights)), size) for size in range(len(weights) + 1)
+                )
+                if all(weights[first] <= weights[second] for first, second in zip(indexes, indexes[1:]))
+            ),
+        )
+
+
+def test_model_parts_keep_only_diagnostic_data():
+    class_def = ast.parse('class A:\n    def foo(self):\n        pass\n\n    X = 1\n').body[0]
+    model_parts_info = get_model_parts_info(class_def, build_ordering_policy().weights)
+    assert model_parts_info == [
+        ModelPart('A', 'foo', 'method', 26, 2, 4),
+        ModelPart('A', 'X', 'constant', 4, 5, 4),
+    ]
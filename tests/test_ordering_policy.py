@@ -0,0 +1,67 @@
+import ast
+from argparse import Namespace
+
+from conftest import run_validator_for_test_file
+from flake8_class_attributes_order import checker as checker_module
+from flake8_class_attributes_order.checker import ClassAttributesOrderChecker
+from flake8_class_attributes_order.node_type_weights import NON_STRICT_NODE_TYPE_WEIGHTS, STRICT_NODE_TYPE_WEIGHTS
+from flake8_class_attributes_order.ordering_policy import get_ordering_policy
+
+
+def test_policy_is_memoized_by_options_fingerprint():
+    first_policy = get_ordering_policy(Namespace(
+        use_class_attributes_order_strict_mode=False,
+        class_attributes_order=['field', 'method'],
+    ))
+    second_policy = get_ordering_policy(Namespace(
+        use_class_attributes_order_strict_mode=False,
+        class_attributes_order=['field', 'method'],
+        ignore_docstring=False,
+    ))
+    assert first_policy is second_policy
+    assert first_policy.weights['field'] < first_policy.weights['method']
+
+
+def test_ignore_docstring_keeps_module_weights_intact():
+    for strict_mode in (False, True):
+        errors = run_validator_for_test_file('late_docstring.py', strict_mode=strict_mode, ignore_docstring=True)
+        assert not errors
+    assert 'docstring' in NON_STRICT_NODE_TYPE_WEIGHTS
+    assert 'docstring' in STRICT_NODE_TYPE_WEIGHTS
+    assert len(run_validator_for_test_file('late_docstring.py')) == 1
+
+
+def make_decision_options(**options):
+    return Namespace(**{
+        'use_class_attributes_order_strict_mode': False,
+        'class_attributes_order': None,
+        'select': None,
+        'extend_select': None,
+        'extended_default_select': ['CCE'],
+        'ignore': None,
+        'extend_ignore': None,
+        'extended_default_ignore': [],
+        **options,
+    })
+
+
+def run_checker(filename, options):
+    tree = ast.parse('class A:\n    def foo(self):\n        pass\n\n    X = 1\n')
+    ClassAttributesOrderChecker.parse_options(options)
+    checker = ClassAttributesOrderChecker(tree, filename)
+    return list(checker.run()), checker.stats
+
+
+def test_checker_does_nothing_when_codes_are_not_selected(monkeypatch):
+    monkeypatch.setattr(checker_module, 'get_model_parts_info', None)
+    errors, stats = run_checker('models.py', make_decision_options(select=['E', 'F']))
+    assert errors == []
+    assert stats == {'disabled_files': 1}
+
+
+def test_checker_skips_files_with_all_codes_ignored_per_file():
+    options = make_decision_options(per_file_ignores='migrations/*:CCE legacy/*:CCE001,CCE002 legacy/new/*:E501')
+    assert run_checker('migrations/0001_initial.py', options) == ([], {'disabled_files': 1})
+    assert run_checker('legacy/models.py', options) == ([], {'disabled_files': 1})
+    assert len(run_checker('legacy/new/models.py', options)[0]) == 1
+    assert len(run_checker('models.py', options)[0]) == 1
@@ -0,0 +1,68 @@
+import json
+
+from conftest import run_validator_for_test_file
+from flake8_class_attributes_order.profiling import PROFILE_ENV_VARIABLE, Profiler, get_profile_path, get_profiler
+from flake8_class_attributes_order.standalone import main
+
+
+def test_profile_collects_phases_and_counters(tmp_path):
+    profile_path = str(tmp_path / 'profile.json')
+    errors = run_validator_for_test_file('errored.py', class_attributes_order_profile=profile_path)
+    get_profiler(profile_path).flush()
+
+    with open(profile_path) as profile_file:
+        summary = json.load(profile_file)
+    assert set(summary['phases']) == {
+        'get_node_weights', 'class_discovery', 'get_model_parts_info', 'get_ordering_errors', 'format_messages',
+    }
+    assert summary['counters']['files'] == 1
+    assert summary['counters']['errors'] == len(errors)
+    assert summary['processes'] == 1
+
+
+def test_profile_flushes_are_merged(tmp_path):
+    profile_path = str(tmp_path / 'profile.json')
+    run_validator_for_test_file('errored.py', class_attributes_order_profile=profile_path)
+    get_profiler(profile_path).flush()
+    worker_profiler = Profiler(profile_path)
+    worker_profiler.count('files')
+    worker_profiler.flush()
+
+    with open(profile_path) as profile_file:
+        summary = json.load(profile_file)
+    assert summary['counters']['files'] == 2
+    assert summary['processes'] == 2
+
+
+def test_profile_is_reset_per_run(tmp_path):
+    profile_path = str(tmp_path / 'profile.json')
+    for _ in range(2):
+        run_validator_for_test_file('errored.py', class_attributes_order_profile=profile_path)
+        get_profiler(profile_path).flush()
+
+    with open(profile_path) as profile_file:
+        summary = json.load(profile_file)
+    assert summary['counters']['files'] == 1
+    assert summary['processes'] == 1
+
+
+def test_standalone_profile_covers_workers_of_last_run(tmp_path):
+    profile_path = str(tmp_path / 'profile.json')
+    for filename in ('a.py', 'b.py'):
+        (tmp_path / filename).write_text('class A:\n    def foo(self):\n        pass\n\n    X = 1\n')
+    for _ in range(2):
+        assert main(['--isolated', '-j', '2', '--class-attributes-order-profile', profile_path, str(tmp_path)]) == 1
+
+    with open(profile_path) as profile_file:
+        summary = json.load(profile_file)
+    assert summary['counters']['files'] == 2
+
+
+def test_profiling_is_disabled_by_default(monkeypatch):
+    monkeypatch.delenv(PROFILE_ENV_VARIABLE, raising=False)
+    assert get_profiler(get_profile_path(object())) is None
+
+
+def test_profile_path_from_environment(monkeypatch):
+    monkeypatch.setenv(PROFILE_ENV_VARIABLE, 'profile.json')
+    assert get_profile_path(object()) == 'profile.json'
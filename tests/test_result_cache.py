@@ -0,0 +1,61 @@
+import ast
+from argparse import Namespace
+
+from flake8_class_attributes_order import checker
+from flake8_class_attributes_order.checker import ClassAttributesOrderChecker
+from flake8_class_attributes_order.result_cache import ResultCache, get_cache_key
+from flake8_class_attributes_order.standalone import main
+
+
+ERRORED_SOURCE = 'class A:\n    def foo(self):\n        pass\n\n    X = 1\n'
+
+
+def run_cached_checker(source, cache_dir, strict_mode=False):
+    ClassAttributesOrderChecker.parse_options(Namespace(
+        use_class_attributes_order_strict_mode=strict_mode,
+        class_attributes_order=None,
+        class_attributes_order_cache_dir=str(cache_dir),
+        class_attributes_order_cache_size=1,
+    ))
+    lines = source.splitlines(keepends=True)
+    return list(ClassAttributesOrderChecker(ast.parse(source), 'errored.py', lines).run())
+
+
+def test_cache_hit_skips_classification(tmp_path, monkeypatch):
+    errors = run_cached_checker(ERRORED_SOURCE, tmp_path)
+    assert len(errors) == 1
+
+    def fail_on_classification(*args):
+        raise AssertionError('cached file was classified again')
+
+    monkeypatch.setattr(checker, 'get_model_parts_info', fail_on_classification)
+    assert run_cached_checker(ERRORED_SOURCE, tmp_path) == errors
+
+
+def test_cache_key_depends_on_content_and_policy():
+    assert get_cache_key(b'class A: pass', 'policy') == get_cache_key(b'class A: pass', 'policy')
+    assert get_cache_key(b'class A: pass', 'policy') != get_cache_key(b'class B: pass', 'policy')
+    assert get_cache_key(b'class A: pass', 'policy') != get_cache_key(b'class A: pass', 'other_policy')
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    result_cache = ResultCache(str(tmp_path), max_size=300)
+    for key_index in range(10):
+        result_cache.store(f'key_{key_index}', [(1, 0, 'CCE001 A.foo should be after A.X')])
+    result_cache.load('key_0')
+    result_cache.evict()
+    assert result_cache.load('key_0') is not None
+    assert result_cache.load('key_9') is not None
+    assert result_cache.load('key_1') is None
+
+
+def test_standalone_reuses_cached_results(tmp_path, capsys, monkeypatch):
+    source_path = tmp_path / 'errored.py'
+    source_path.write_text(ERRORED_SOURCE)
+    cache_args = ['--isolated', '-j', '1', '--class-attributes-order-cache-dir', str(tmp_path / 'cache')]
+    assert main([*cache_args, str(source_path)]) == 1
+    output = capsys.readouterr().out
+
+    monkeypatch.setattr(ast, 'parse', lambda *args, **kwargs: ast.Module(body=[], type_ignores=[]))
+    assert main([*cache_args, str(source_path)]) == 1
+    assert capsys.readouterr().out == output
@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+from flake8_class_attributes_order.source_prefilter import may_contain_class
+from flake8_class_attributes_order.standalone import main
+
+
+TEST_FILES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_files')
+
+
+@pytest.mark.parametrize('source', [
+    b'class A:\n    pass\n',
+    b'\xef\xbb\xbfclass A:\n    pass\n',
+    b'def foo():\n\tclass A:\n\t\tpass\n',
+    b'@decorator\nclass A:\n    pass\n',
+    b'if True: class A: pass\n',
+    b'x = 1; class A: pass\n',
+    b'import os\r\rclass A:\r    pass\r',
+])
+def test_sources_with_class_statements_are_not_skipped(source):
+    assert may_contain_class(source)
+
+
+@pytest.mark.parametrize('source', [
+    b'',
+    b'import os\n\n\ndef foo():\n    return os.sep\n',
+    b'subclass = 1\nclass_name = "A"\nmy_class = type(class_name, (), {})\n',
+])
+def test_sources_without_class_statements_are_skipped(source):
+    assert not may_contain_class(source)
+
+
+def test_all_test_files_pass_prefilter():
+    for filename in os.listdir(TEST_FILES_DIR):
+        with open(os.path.join(TEST_FILES_DIR, filename), 'rb') as file_handler:
+            assert may_contain_class(file_handler.read()), filename
+
+
+def test_skipped_files_are_counted_in_run_stats(tmp_path, capsys):
+    (tmp_path / 'script.py').write_text('import sys\n\nsys.exit(0)\n')
+    (tmp_path / 'empty.py').write_text('')
+    (tmp_path / 'model.py').write_text('class A:\n    def foo(self):\n        pass\n\n    X = 1\n')
+    assert main(['--isolated', '-j', '1', '--show-run-stats', str(tmp_path)]) == 1
+    captured = capsys.readouterr()
+    assert len(captured.out.splitlines()) == 1
+    assert 'files: 3\n' in captured.err
+    assert 'skipped_files: 2\n' in captured.err
+    assert 'skipped_bytes: 24\n' in captured.err
+
+
+def test_skipped_files_are_not_parsed(tmp_path, capsys):
+    (tmp_path / 'script.py').write_text('def foo(:\n    pass\n')
+    (tmp_path / 'model.py').write_text('class A(:\n')
+    assert main(['--isolated', '-j', '1', '--show-run-stats', str(tmp_path)]) == 1
+    captured = capsys.readouterr()
+    assert [line.split(': ', 1)[0] for line in captured.out.splitlines()] == [f'{tmp_path / "model.py"}:1:9']
+    assert 'skipped_files: 1\n' in captured.err
@@ -0,0 +1,85 @@
+import json
+import os
+
+from flake8_class_attributes_order.standalone import main
+
+
+TEST_FILES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_files')
+
+
+def test_standalone_output_matches_in_serial_and_parallel_runs(capsys):
+    assert main(['--isolated', '-j', '1', TEST_FILES_DIR]) == 1
+    serial_output = capsys.readouterr().out
+    assert main(['--isolated', '-j', '2', TEST_FILES_DIR]) == 1
+    assert capsys.readouterr().out == serial_output
+    expected_line = (
+        f'{os.path.join(TEST_FILES_DIR, "private_errored.py")}:2:5: '
+        'CCE001 A.get_tabs_info should be after A.__get_favicon_path'
+    )
+    assert expected_line in serial_output.splitlines()
+
+
+def test_standalone_uses_plugin_options(capsys):
+    errored_file = os.path.join(TEST_FILES_DIR, 'strict_errored.py')
+    assert main(['--isolated', '-j', '1', errored_file]) == 0
+    assert main(['--isolated', '-j', '1', '--use-class-attributes-order-strict-mode', errored_file]) == 1
+    assert len(capsys.readouterr().out.splitlines()) == 2
+
+
+def test_standalone_respects_noqa_and_reports_syntax_errors(tmp_path, capsys):
+    (tmp_path / 'noqa.py').write_text('class A:\n    def foo(self):  # noqa: CCE001\n        pass\n\n    X = 1\n')
+    (tmp_path / 'broken.py').write_text('class A(:\n')
+    (tmp_path / 'excluded').mkdir()
+    (tmp_path / 'excluded' / 'errored.py').write_text('class A:\n    def foo(self):\n        pass\n\n    X = 1\n')
+    assert main(['--isolated', '-j', '1', '--exclude', 'excluded', str(tmp_path)]) == 1
+    output_lines = capsys.readouterr().out.splitlines()
+    assert len(output_lines) == 1
+    assert output_lines[0].startswith(f'{tmp_path / "broken.py"}:1:')
+    assert ': E999 SyntaxError: ' in output_lines[0]
+
+
+def test_stats_only_counts_violations_per_code_directory_and_class(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'pkg').mkdir()
+    (tmp_path / 'pkg' / 'models.py').write_text(
+        'class A:\n    def foo(self):\n        pass\n\n    X = 1\n\n'
+        '    class B:\n        def bar(self):  # noqa: CCE001\n            pass\n\n        Y = 2\n        print(Y)\n',
+    )
+    (tmp_path / 'api.py').write_text('class C:\n    def foo(self):\n        pass\n\n    X = 1\n')
+    stats_args = ['--isolated', '-j', '1', '--stats-only']
+    assert main([*stats_args, '--class-attributes-order-max-errors-per-file', '1', '.']) == 0
+    assert json.loads(capsys.readouterr().out) == {
+        'codes': {'CCE001': 3, 'CCE002': 1},
+        'directories': {'.': {'CCE001': 1}, 'pkg': {'CCE001': 2, 'CCE002': 1}},
+        'classes': {
+            'api.py::C': {'CCE001': 1},
+            'pkg/models.py::A': {'CCE001': 2},
+            'pkg/models.py::A.B': {'CCE002': 1},
+        },
+    }
+    assert main([*stats_args, '--stats-format', 'csv', 'api.py']) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        'scope,name,code,count', 'total,,CCE001,1', 'directory,.,CCE001,1', 'class,api.py::C,CCE001,1',
+    ]
+
+
+def test_standalone_respects_select_and_per_file_ignores(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'setup.cfg').write_text(
+        '[flake8]\nextend-ignore = CCE002\nper-file-ignores = legacy/*: CCE001\n',
+    )
+    source = 'class A:\n    def foo(self):\n        pass\n\n    X = 1\n    print(X)\n'
+    (tmp_path / 'legacy').mkdir()
+    (tmp_path / 'legacy' / 'models.py').write_text(source)
+    (tmp_path / 'models.py').write_text(source)
+    assert main(['-j', '1', '.']) == 1
+    assert capsys.readouterr().out == './models.py:2:5: CCE001 A.foo should be after A.X\n'
+    assert main(['-j', '1', '--select', 'CCE002', '.']) == 0
+    assert capsys.readouterr().out == ''
+
+
+def test_standalone_disable_noqa(tmp_path, capsys):
+    (tmp_path / 'noqa.py').write_text('class A:\n    def foo(self):  # noqa: CCE001\n        pass\n\n    X = 1\n')
+    assert main(['--isolated', '-j', '1', str(tmp_path)]) == 0
+    assert main(['--isolated', '-j', '1', '--disable-noqa', str(tmp_path)]) == 1
+    assert capsys.readouterr().out == f'{tmp_path / "noqa.py"}:2:5: CCE001 A.foo should be after A.X\n'